@@ -0,0 +1,269 @@
+import hashlib
+import heapq
+import os
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+# Importar funciones reutilizables (el directorio padre ya está en sys.path, ver app.py)
+from contar_frecuencia_nombres import ContadorFrecuencias, _clave_frecuencia
+from indice_prefijos import IndicePrefijos
+from registro_nombre import RegistroNombre, clave_alfabetica
+
+# Archivos analizados que se conservan en memoria
+MAX_CACHED_FILES = 5
+# Longitud mínima (exclusiva) del primer nombre en la vista filtrada
+FILTER_MIN_LENGTH = 4
+# Tamaño de cada lectura al calcular el hash de un archivo
+HASH_CHUNK_SIZE = 1024 * 1024
+# Si los nombres nuevos son más que esta fracción de los existentes, se mezclan con heapq.merge
+# en vez de ubicarlos uno a uno con bisect
+MERGE_FRACTION = 16
+# Hasta esta cantidad de primeros nombres cambiados, el listado de frecuencias se corrige con bisect;
+# con más, se vuelve a ordenar cuando se muestra
+MAX_RANKING_UPDATES = 1024
+
+
+def new_hasher() -> Any:
+    return hashlib.blake2b(digest_size=16)
+
+
+def file_digest(path: str) -> bytes:
+    hasher = new_hasher()
+    with open(path, "rb") as archivo:
+        for chunk in iter(lambda: archivo.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+def merge_sorted(existing: list[RegistroNombre], new: list[RegistroNombre]) -> list[RegistroNombre]:
+    # Ambas listas ordenadas con clave_alfabetica; a igual clave, los existentes quedan primero
+    # (como al ordenar el archivo completo). existing no se modifica: puede estar mostrándose
+    if not existing:
+        return new
+    if len(new) > len(existing) // MERGE_FRACTION:
+        return list(heapq.merge(existing, new, key=clave_alfabetica))
+    # Pocos nombres nuevos: cada uno se ubica con bisect y los tramos intermedios se copian enteros
+    merged: list[RegistroNombre] = []
+    start = 0
+    for name in new:
+        position = bisect_right(existing, clave_alfabetica(name), start, key=clave_alfabetica)
+        merged += existing[start:position]
+        merged.append(name)
+        start = position
+    merged += existing[start:]
+    return merged
+
+
+class FileKey(NamedTuple):
+    # Identifica un contenido de archivo: si cambia cualquiera de los campos, el análisis no sirve
+    path: str
+    size: int
+    mtime_ns: int
+    digest: bytes
+
+    def matches(self, path: str, stat: os.stat_result) -> bool:
+        return self.path == path and self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+class FileAnalysis:
+    """
+    Todas las vistas de un archivo de nombres, calculadas en una sola pasada
+    sobre los registros ya ordenados alfabéticamente: frecuencias del primer
+    nombre, filtrados por longitud, cubetas por longitud e iniciales.
+    Las vistas derivadas (más comunes, orden por longitud, índice de prefijos)
+    se arman con build_views() en el hilo de trabajo, o la primera vez que se piden.
+
+    Una vez armado no se modifica: extended() devuelve un análisis nuevo con
+    los nombres agregados al final del archivo, sin recalcular lo anterior,
+    para armarlo en el hilo de trabajo mientras el hilo de Tk sigue usando
+    este. Si cambian muchos primeros nombres, el listado completo de
+    frecuencias se vuelve a ordenar recién cuando se muestra.
+    offset, line_count y hasher indican hasta dónde se leyó el archivo.
+    """
+
+    def __init__(self, names: list[RegistroNombre], report: list[str]) -> None:
+        self.names: list[RegistroNombre] = []
+        self.report = report
+        self.counter = ContadorFrecuencias()
+        self.filtered: list[RegistroNombre] = []
+        self.by_length: dict[int, list[RegistroNombre]] = {}
+        self.initials: dict[str, int] = {}
+        self.length_sum = 0
+        # Bytes y líneas del archivo ya analizados, y hash de esos bytes (los completa quien lee el archivo)
+        self.offset = 0
+        self.line_count = 0
+        self.ends_with_newline = True
+        self.hasher: Any = None
+        # Líneas rechazadas: cantidad y primeros ejemplos, para rehacer el informe al agregar líneas
+        self.invalid_count = 0
+        self.invalid_examples: list[str] = []
+        self._most_common: list[tuple[str, int]] | None = None
+        # Los k más comunes (con heap, sin ordenar todo) por cada k pedido
+        self._top_common: dict[int, list[tuple[str, int]]] = {}
+        self._sorted_by_length: list[RegistroNombre] | None = None
+        self._prefix_index: IndicePrefijos | None = None
+        self._add(names)
+
+    def extended(self, names: list[RegistroNombre], report: list[str]) -> "FileAnalysis":
+        # Copia con los nombres nuevos (ordenados con clave_alfabetica). Las listas sin cambios se
+        # comparten: ningún análisis modifica sus listas una vez armado. De las vistas derivadas
+        # solo se corrigen las que ya estaban armadas, y solo por los primeros nombres que cambiaron
+        analysis = FileAnalysis([], report)
+        analysis.names = self.names
+        analysis.counter = self.counter.copiar()
+        analysis.filtered = self.filtered
+        analysis.by_length = dict(self.by_length)
+        analysis.initials = dict(self.initials)
+        analysis.length_sum = self.length_sum
+        added = analysis._add(names)
+        changed = [(first, analysis.counter[first]) for first in added]
+        for k, top in self._top_common.items():
+            # Los demás nombres no cambiaron: ninguno puede superar a los k que ya estaban arriba
+            candidates = [item for item in top if item[0] not in added] + changed
+            analysis._top_common[k] = heapq.nsmallest(k, candidates, key=_clave_frecuencia)
+        if self._most_common is not None and len(changed) <= MAX_RANKING_UPDATES:
+            ranking = self._most_common[:]
+            for first, count in changed:
+                previous = count - added[first]
+                if previous:
+                    del ranking[bisect_left(ranking, _clave_frecuencia((first, previous)), key=_clave_frecuencia)]
+                insort(ranking, (first, count), key=_clave_frecuencia)
+            analysis._most_common = ranking
+        if self._sorted_by_length is not None:
+            analysis.sorted_by_length()
+        if self._prefix_index is not None:
+            analysis._prefix_index = self._prefix_index.fusionar_ordenados(names)
+        return analysis
+
+    def _add(self, names: list[RegistroNombre]) -> dict[str, int]:
+        # names debe venir ordenado con clave_alfabetica; devuelve cuánto sumó cada primer nombre
+        if not names:
+            return {}
+        frequencies: dict[str, int] = {}
+        filtered: list[RegistroNombre] = []
+        by_length: dict[int, list[RegistroNombre]] = {}
+        initials = self.initials
+        length_sum = 0
+        for name in names:
+            first = name.nombre
+            length = name.longitud_nombre
+            frequencies[first] = frequencies.get(first, 0) + 1
+            if length > FILTER_MIN_LENGTH:
+                filtered.append(name)
+            bucket = by_length.get(length)
+            if bucket is None:
+                by_length[length] = bucket = []
+            bucket.append(name)
+            initial = first[0].upper() if first else "?"
+            initials[initial] = initials.get(initial, 0) + 1
+            length_sum += length
+        self.names = merge_sorted(self.names, names)
+        self.counter.fusionar(frequencies)
+        self.filtered = merge_sorted(self.filtered, filtered)
+        for length, bucket in by_length.items():
+            self.by_length[length] = merge_sorted(self.by_length.get(length, []), bucket)
+        self.length_sum += length_sum
+        return frequencies
+
+    def most_common(self) -> list[tuple[str, int]]:
+        if self._most_common is None:
+            self._most_common = self.counter.mas_comunes()
+        return self._most_common
+
+    def top_common(self, k: int) -> list[tuple[str, int]]:
+        # Para el gráfico: no hace falta el listado completo ordenado
+        top = self._top_common.get(k)
+        if top is None:
+            if self._most_common is not None:
+                top = self._most_common[:k]
+            else:
+                top = self.counter.mas_comunes(k)
+            self._top_common[k] = top
+        return top
+
+    def lengths(self) -> list[int]:
+        # De mayor a menor, como ordenar_por_longitud_descendente
+        return sorted(self.by_length, reverse=True)
+
+    def sorted_by_length(self) -> list[RegistroNombre]:
+        if self._sorted_by_length is None:
+            ordered: list[RegistroNombre] = []
+            for length in self.lengths():
+                ordered.extend(self.by_length[length])
+            self._sorted_by_length = ordered
+        return self._sorted_by_length
+
+    def length_counts(self) -> list[tuple[int, int]]:
+        return [(length, len(self.by_length[length])) for length in self.lengths()]
+
+    def prefix_index(self) -> IndicePrefijos:
+        if self._prefix_index is None:
+            # names ya está ordenado por clave: el índice se arma en una pasada
+            self._prefix_index = IndicePrefijos(self.names, ordenados=True)
+        return self._prefix_index
+
+    def build_views(self, *top_k: int) -> None:
+        # Arma de una vez todas las vistas derivadas (y los top_common pedidos); se llama en el hilo
+        # de trabajo al cargar el archivo para que el hilo de Tk no tenga que ordenar ni indexar al mostrar una vista
+        self.most_common()
+        for k in top_k:
+            self.top_common(k)
+        self.sorted_by_length()
+        self.prefix_index()
+
+
+def find_cached(entries: list[tuple[FileKey, FileAnalysis]], path: str,
+                stat: os.stat_result) -> tuple[FileKey, FileAnalysis] | None:
+    """
+    Busca el análisis de un archivo en una copia de las entradas del caché
+    (AnalysisCache.snapshot). No modifica nada, así que puede correr en el
+    hilo de trabajo; quien la llama guarda la clave devuelta con store().
+    Para no leer el archivo dos veces, el hash solo se calcula si hay algún
+    análisis guardado del mismo tamaño; si no, lo calcula quien analiza el
+    archivo mientras lo lee.
+    """
+    for key, analysis in entries:
+        if key.matches(path, stat):
+            return key, analysis
+    same_size = [(key, analysis) for key, analysis in entries if key.size == stat.st_size]
+    if not same_size:
+        return None
+    # Mismo tamaño con otra ruta o fecha: se compara el contenido (archivo tocado, copiado o reabierto)
+    digest = file_digest(path)
+    for key, analysis in same_size:
+        if key.digest == digest:
+            return FileKey(path, stat.st_size, stat.st_mtime_ns, digest), analysis
+    return None
+
+
+class AnalysisCache:
+    """
+    LRU acotado de análisis por contenido de archivo, con clave FileKey.
+    Solo se modifica desde el hilo de Tk; las búsquedas del hilo de trabajo
+    usan find_cached sobre una copia.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_FILES) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[FileKey, FileAnalysis] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def snapshot(self) -> list[tuple[FileKey, FileAnalysis]]:
+        # Copia de las entradas para buscar desde el hilo de trabajo sin tocar el OrderedDict
+        return list(self.entries.items())
+
+    def store(self, key: FileKey, analysis: FileAnalysis) -> None:
+        # Una ruta tiene un solo contenido vigente: se descartan sus claves anteriores
+        for old_key in [old for old in self.entries if old.path == key.path and old != key]:
+            del self.entries[old_key]
+        self.entries[key] = analysis
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def discard(self, analysis: FileAnalysis) -> None:
+        for key in [key for key, cached in self.entries.items() if cached is analysis]:
+            del self.entries[key]
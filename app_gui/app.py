@@ -1,39 +1,242 @@
+import time
+
+# Momento en que empieza a cargarse el módulo (referencia de --medir-inicio)
+IMPORT_START = time.perf_counter()
+
+import argparse
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
+from tkinter import filedialog, messagebox, ttk
+import heapq
 import os
+import queue
 import sys
-from typing import Literal
-import io
-import contextlib
+import threading
+from typing import Any, Callable, Iterator, Literal, NamedTuple, Sequence
 
-# Asegurar que podamos importar módulos del directorio padre
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+# Asegurar que podamos importar módulos del directorio padre y de esta carpeta
+# (también al importar app_gui.app como paquete, sin ejecutar el script)
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(APP_DIR)
+for directory in (PROJECT_ROOT, APP_DIR):
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
 
 # Importar funciones reutilizables
-from ordenar_nombres import ordenar_nombres_alfabeticamente
-from contar_frecuencia_nombres import contar_frecuencia_nombres
+from registro_nombre import RegistroNombre, clave_alfabetica
+from validacion_nombres import lineas_advertencia, validar_nombres
 from exportar_frecuencias import exportar_frecuencias_a_archivo
-from ordenar_por_longitud import ordenar_por_longitud_descendente
-from filtrar_nombres_largos import filtrar_nombres_largos
 
-# Matplotlib para gráficos embebidos
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+# Módulos de esta misma carpeta: lista virtualizada y caché de análisis por archivo
+from virtual_list import LazyRows, VirtualListView
+from analysis_cache import FILTER_MIN_LENGTH, AnalysisCache, FileAnalysis, FileKey, find_cached, new_hasher
+
+IMPORT_END = time.perf_counter()
+
+# Máximo de coincidencias que se listan en la búsqueda por prefijo
+SEARCH_LIMIT = 200
+# Máximo de barras por gráfico: el resto se agrupa en "Otros" o en intervalos
+CHART_MAX_BARS = 20
+# Cada cuántos milisegundos el hilo de Tk revisa los mensajes de la tarea en segundo plano
+POLL_INTERVAL_MS = 50
+# Cantidad de avisos de progreso durante la lectura del archivo (uno por cada 1%)
+PROGRESS_STEPS = 100
+# Espera tras mostrar la ventana antes de precargar matplotlib en segundo plano
+WARM_UP_DELAY_MS = 500
+# Cada cuántos milisegundos se revisa si el archivo creció (modo seguimiento)
+TAIL_POLL_MS = 1000
+# Ejemplos de líneas inválidas que se listan en el informe
+REPORT_EXAMPLES = 5
+
+ViewKind = Literal["alpha", "freq", "filter", "len", "search", "msg"]
+
+
+class OperationCancelled(Exception):
+    """La tarea en segundo plano se detuvo porque el usuario la canceló."""
+
+
+class ViewResult(NamedTuple):
+    # Resultado listo para mostrar: texto o filas, argumentos de plot_bar (o None) y tipo de vista
+    kind: ViewKind | None
+    content: str | Sequence[str]
+    chart: tuple | None = None
+
+
+class Worker:
+    """
+    Ejecuta una tarea en un hilo aparte. La tarea no toca la interfaz ni el
+    estado de la aplicación: informa progreso y resultado por una cola que el
+    hilo de Tk revisa con after(), y on_done asigna el estado nuevo en el hilo
+    de Tk al terminar.
+    """
+
+    def __init__(self, task: Callable[["Worker"], Any], on_done: Callable[[Any], None]) -> None:
+        self.task = task
+        self.on_done = on_done
+        self.messages: queue.Queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    def check_cancelled(self) -> None:
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+
+    def report(self, fraction: float | None) -> None:
+        # None: etapa sin progreso medible (barra indeterminada)
+        self.messages.put(("progress", fraction))
+
+    def _run(self) -> None:
+        try:
+            result = self.task(self)
+        except OperationCancelled:
+            self.messages.put(("cancelled", None))
+        except Exception as e:
+            self.messages.put(("error", e))
+        else:
+            self.messages.put(("done", result))
+
+
+_matplotlib_classes: tuple[Any, Any] | None = None
+_matplotlib_lock = threading.Lock()
+
+
+def load_matplotlib() -> tuple[Any, Any]:
+    # Matplotlib se importa recién cuando hace falta un gráfico (o en la precarga):
+    # es lo más lento del inicio y la ventana no lo necesita para aparecer
+    global _matplotlib_classes
+    with _matplotlib_lock:
+        if _matplotlib_classes is None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+            _matplotlib_classes = (Figure, FigureCanvasTkAgg)
+    return _matplotlib_classes
+
+
+def warm_up_matplotlib() -> None:
+    try:
+        load_matplotlib()
+    except ImportError:
+        # Se informa al pedir el primer gráfico
+        pass
+
+
+def top_with_others(labels: list[str], values: list[int], limit: int = CHART_MAX_BARS) -> tuple[list[str], list[int]]:
+    # Las limit - 1 barras más altas (en el orden recibido) y una barra "Otros" con la suma del resto
+    if len(values) <= limit:
+        return list(labels), list(values)
+    keep = sorted(heapq.nlargest(limit - 1, range(len(values)), key=values.__getitem__))
+    top_labels = [labels[i] for i in keep] + ["Otros"]
+    top_values = [values[i] for i in keep]
+    top_values.append(sum(values) - sum(top_values))
+    return top_labels, top_values
+
+
+def bin_lengths(counts: list[tuple[int, int]], max_bins: int = CHART_MAX_BARS) -> tuple[list[str], list[int]]:
+    # Histograma de (longitud, cantidad) ordenado por longitud; si hay muchas, se agrupan en intervalos
+    if not counts:
+        return [], []
+    lengths = [length for length, _ in counts]
+    shortest = min(lengths)
+    width = -(-(max(lengths) - shortest + 1) // max_bins)
+    if width == 1:
+        return [str(length) for length in lengths], [count for _, count in counts]
+    bins: dict[int, int] = {}
+    for length, count in counts:
+        key = (length - shortest) // width
+        bins[key] = bins.get(key, 0) + count
+    labels = [f"{shortest + key * width}-{shortest + key * width + width - 1}" for key in bins]
+    return labels, list(bins.values())
+
+
+class LineReader:
+    """
+    Iterable con las líneas de un archivo a partir del byte start. Lee en modo
+    binario para medir el progreso por bytes leídos (sin tell() en modo texto)
+    y dejar en offset hasta dónde se consumió; si se pasa un hasher, se
+    actualiza con el contenido en la misma lectura. Con complete_only, una
+    última línea sin salto de línea (que todavía se está escribiendo) no se lee.
+    """
+
+    def __init__(self, path: str, worker: Worker, hasher: Any = None, start: int = 0,
+                 complete_only: bool = False) -> None:
+        self.path = path
+        self.worker = worker
+        self.hasher = hasher
+        self.start = start
+        self.complete_only = complete_only
+        self.offset = start
+        self.ends_with_newline = True
+
+    def __iter__(self) -> Iterator[str]:
+        total = max(1, os.path.getsize(self.path) - self.start)
+        step = max(1, total // PROGRESS_STEPS)
+        read = 0
+        next_report = 0
+        with open(self.path, "rb") as archivo:
+            archivo.seek(self.start)
+            for raw in archivo:
+                ends_with_newline = raw.endswith(b"\n")
+                if self.complete_only and not ends_with_newline:
+                    break
+                read += len(raw)
+                self.offset += len(raw)
+                self.ends_with_newline = ends_with_newline
+                if self.hasher is not None:
+                    self.hasher.update(raw)
+                if read >= next_report:
+                    self.worker.check_cancelled()
+                    self.worker.report(min(1.0, read / total))
+                    next_report = read + step
+                line = raw.decode("utf-8")
+                if "\r" in line:
+                    # Mismos finales de línea que el modo texto ('\r\n' y '\r')
+                    line = line.replace("\r\n", "\n").replace("\r", "\n")
+                    yield from line[:-1].split("\n") if line.endswith("\n") else line.split("\n")
+                else:
+                    yield line
+
+
+class LoadResult(NamedTuple):
+    # Análisis armado (o encontrado en el caché) en el hilo de trabajo; el hilo de Tk lo guarda y lo asigna
+    analysis: FileAnalysis
+    key: FileKey | None = None
+    cacheable: bool = False
+
+
+class TailResult(NamedTuple):
+    # Análisis con las líneas agregadas al archivo, armado en el hilo de trabajo; el hilo de Tk solo lo reemplaza
+    analysis: FileAnalysis
+    key: FileKey
+    added: int
+    line_count: int
 
 
 class App(tk.Tk):
-    def __init__(self) -> None:
+    def __init__(self, warm_up_charts: bool = True) -> None:
         super().__init__()
         self.title("Procesamiento de Nombres - GUI")
         self.geometry("1200x650")
 
         self.selected_file: str | None = None
-        self.loaded_names: list[str] = []
-        self.last_view_kind: Literal["alpha", "freq", "filter", "len", "msg"] = "msg"
+        # Análisis del archivo actual y la clave (ruta, tamaño, fecha, hash) con la que se obtuvo
+        self.analysis: FileAnalysis | None = None
+        self.analysis_key: FileKey | None = None
+        # Análisis de los últimos archivos abiertos, para volver a ellos sin releerlos
+        self.analysis_cache = AnalysisCache()
+        self.last_view_kind: ViewKind = "msg"
+        self.worker: Worker | None = None
+        # Revisión periódica del archivo en modo seguimiento (id de after o None)
+        self.tail_job: str | None = None
 
         self.create_widgets()
+        if warm_up_charts:
+            # Una vez visible la ventana, importar matplotlib en otro hilo para que el primer gráfico sea rápido
+            self.after(WARM_UP_DELAY_MS, lambda: threading.Thread(target=warm_up_matplotlib, daemon=True).start())
 
     def create_widgets(self) -> None:
         top_frame = tk.Frame(self)
@@ -41,6 +244,8 @@ class App(tk.Tk):
 
         btn_select = tk.Button(top_frame, text="Seleccionar archivo", command=self.select_file)
         btn_select.pack(side=tk.LEFT)
+        # Botones que se desactivan mientras hay una tarea en segundo plano
+        self.action_buttons: list[tk.Button] = [btn_select]
 
         self.lbl_file = tk.Label(top_frame, text="Ningún archivo seleccionado", anchor="w")
         self.lbl_file.pack(side=tk.LEFT, padx=10)
@@ -48,11 +253,38 @@ class App(tk.Tk):
         actions = tk.Frame(self)
         actions.pack(fill=tk.X, padx=10, pady=5)
 
-        tk.Button(actions, text="Ordenar alfabéticamente", command=self.action_sort_alpha).pack(side=tk.LEFT, padx=5)
-        tk.Button(actions, text="Frecuencia por nombre", command=self.action_frequency).pack(side=tk.LEFT, padx=5)
-        tk.Button(actions, text="Exportar frecuencias", command=self.action_export_freq).pack(side=tk.LEFT, padx=5)
-        tk.Button(actions, text="Filtrar primer nombre > 4", command=self.action_filter_long_first).pack(side=tk.LEFT, padx=5)
-        tk.Button(actions, text="Ordenar por longitud 1er nombre", command=self.action_sort_by_first_len).pack(side=tk.LEFT, padx=5)
+        for text, command in (("Ordenar alfabéticamente", self.action_sort_alpha),
+                              ("Frecuencia por nombre", self.action_frequency),
+                              ("Exportar frecuencias", self.action_export_freq),
+                              ("Filtrar primer nombre > 4", self.action_filter_long_first),
+                              ("Ordenar por longitud 1er nombre", self.action_sort_by_first_len)):
+            button = tk.Button(actions, text=text, command=command)
+            button.pack(side=tk.LEFT, padx=5)
+            self.action_buttons.append(button)
+
+        # Progreso de la tarea en segundo plano y botón para cancelarla
+        status = tk.Frame(self)
+        status.pack(fill=tk.X, padx=10, pady=5)
+        self.progress = ttk.Progressbar(status, orient=tk.HORIZONTAL, length=300, mode="determinate", maximum=100)
+        self.progress.pack(side=tk.LEFT)
+        self.btn_cancel = tk.Button(status, text="Cancelar", command=self.cancel_task, state=tk.DISABLED)
+        self.btn_cancel.pack(side=tk.LEFT, padx=5)
+        self.lbl_status = tk.Label(status, text="", anchor="w")
+        self.lbl_status.pack(side=tk.LEFT, padx=10)
+        # Modo seguimiento: se leen solo las líneas que se agregan al final del archivo
+        self.follow_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(status, text="Seguir cambios del archivo", variable=self.follow_var,
+                       command=self.toggle_follow).pack(side=tk.RIGHT)
+
+        # Búsqueda por prefijo (sin distinguir acentos) mientras se escribe
+        search = tk.Frame(self)
+        search.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(search, text="Buscar nombre:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *_: self.action_search())
+        tk.Entry(search, textvariable=self.search_var, width=40).pack(side=tk.LEFT, padx=5)
+        self.lbl_search = tk.Label(search, text="", anchor="w")
+        self.lbl_search.pack(side=tk.LEFT, padx=10)
 
         # Contenedor dividido: texto a la izquierda, gráfico a la derecha
         split = tk.PanedWindow(self, orient=tk.HORIZONTAL, sashrelief=tk.RIDGE)
@@ -63,15 +295,20 @@ class App(tk.Tk):
         split.add(left_panel, stretch="always")
         split.add(right_panel)
 
-        self.output = scrolledtext.ScrolledText(left_panel, wrap=tk.WORD, height=25, width=80)
+        # Solo se dibujan las filas visibles: el resultado completo queda en memoria una sola vez
+        self.output = VirtualListView(left_panel, height=25, width=80)
         self.output.pack(fill=tk.BOTH, expand=True)
 
-        # Figura de Matplotlib
-        self.fig = Figure(figsize=(5.5, 4.5), dpi=100)
-        self.ax = self.fig.add_subplot(111)
-        self.ax.set_visible(False)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right_panel)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # La figura de Matplotlib se crea con el primer gráfico (ensure_chart)
+        self.chart_panel = right_panel
+        self.chart_placeholder = tk.Label(right_panel, text="El gráfico aparece al procesar el archivo.",
+                                          width=55, fg="gray")
+        self.chart_placeholder.pack(fill=tk.BOTH, expand=True)
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        # Barras del gráfico actual: se reutilizan si solo cambian los datos
+        self.bars = None
 
     def select_file(self) -> None:
         file_path = filedialog.askopenfilename(title="Selecciona archivo de nombres",
@@ -80,7 +317,9 @@ class App(tk.Tk):
             return
         self.selected_file = file_path
         self.lbl_file.config(text=file_path)
-        self.loaded_names = []  # Reset
+        # El análisis anterior queda en el caché por si se vuelve a abrir ese archivo
+        self.analysis = None
+        self.analysis_key = None
         self.last_view_kind = "msg"
         self.output_message("Archivo seleccionado. Usa un botón para procesar.")
         self.clear_chart()
@@ -91,156 +330,471 @@ class App(tk.Tk):
             return False
         return True
 
-    def output_message(self, text: str) -> None:
-        self.output.delete(1.0, tk.END)
-        self.output.insert(tk.END, text)
+    # Tareas en segundo plano
+    def is_busy(self) -> bool:
+        return self.worker is not None
+
+    def run_in_background(self, description: str, task: Callable[[Worker], Any],
+                          on_done: Callable[[Any], None]) -> None:
+        # task corre en otro hilo; on_done recibe su resultado en el hilo de Tk
+        if self.is_busy():
+            return
+        self.worker = Worker(task, on_done)
+        self.set_busy(True, description)
+        self.worker.start()
+        self.after(POLL_INTERVAL_MS, self.poll_worker)
+
+    def set_busy(self, busy: bool, description: str = "") -> None:
+        state = tk.DISABLED if busy else tk.NORMAL
+        for button in self.action_buttons:
+            button.config(state=state)
+        self.btn_cancel.config(state=tk.NORMAL if busy else tk.DISABLED)
+        self.lbl_status.config(text=description)
+        self.progress.stop()
+        self.progress.config(mode="determinate", value=0)
+
+    def show_progress(self, fraction: float | None) -> None:
+        if fraction is None:
+            if str(self.progress.cget("mode")) != "indeterminate":
+                self.progress.config(mode="indeterminate")
+                self.progress.start(15)
+        else:
+            self.progress.config(value=fraction * 100)
+
+    def poll_worker(self) -> None:
+        worker = self.worker
+        if worker is None:
+            return
+        while True:
+            try:
+                kind, payload = worker.messages.get_nowait()
+            except queue.Empty:
+                self.after(POLL_INTERVAL_MS, self.poll_worker)
+                return
+            if kind == "progress":
+                self.show_progress(payload)
+                continue
+            self.worker = None
+            self.set_busy(False)
+            if kind == "done":
+                worker.on_done(payload)
+            elif kind == "cancelled":
+                self.lbl_status.config(text="Operación cancelada.")
+            else:
+                self.output_message(f"[ERROR] Error inesperado: {payload}")
+                self.clear_chart()
+            return
+
+    def cancel_task(self) -> None:
+        if self.worker is not None:
+            self.worker.cancel()
+            self.lbl_status.config(text="Cancelando...")
+
+    def output_message(self, text: str, keep_position: bool = False) -> None:
+        self.output.set_rows(text.split("\n"), keep_position)
+
+    def output_rows(self, rows: Sequence[str], keep_position: bool = False) -> None:
+        self.output.set_rows(rows, keep_position)
+
+    def ensure_chart(self) -> bool:
+        # Crea la figura la primera vez; devuelve False si matplotlib no está disponible
+        if self.canvas is not None:
+            return True
+        try:
+            Figure, FigureCanvasTkAgg = load_matplotlib()
+        except ImportError as e:
+            self.chart_placeholder.config(text=f"No se pudo cargar matplotlib: {e}")
+            return False
+        self.fig = Figure(figsize=(5.5, 4.5), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_visible(False)
+        self.chart_placeholder.pack_forget()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.chart_panel)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        return True
 
     def clear_chart(self) -> None:
+        if self.canvas is None:
+            return
         self.ax.clear()
         self.ax.set_visible(False)
+        self.bars = None
         self.canvas.draw_idle()
 
     def plot_bar(self, labels: list[str], values: list[int], title: str, xlabel: str = "", ylabel: str = "") -> None:
-        self.ax.clear()
-        self.ax.set_visible(True)
+        if not self.ensure_chart():
+            return
+        # Nunca más de CHART_MAX_BARS barras (las acciones ya envían los datos agregados)
+        labels, values = top_with_others(labels, values)
         # Limitar etiquetas largas para no saturar
         display_labels = [lbl if len(lbl) <= 18 else lbl[:16] + "…" for lbl in labels]
-        self.ax.bar(range(len(values)), values, color="#4C78A8")
+        rebuild = self.bars is None or len(self.bars) != len(values)
+        if rebuild:
+            self.ax.clear()
+            self.bars = self.ax.bar(range(len(values)), values, color="#4C78A8")
+            self.ax.set_xticks(range(len(values)))
+        else:
+            # Misma cantidad de barras: solo cambian las alturas, sin crear artistas nuevos
+            for bar, value in zip(self.bars, values):
+                bar.set_height(value)
+            self.ax.relim()
+            self.ax.autoscale_view(scalex=False)
+        self.ax.set_visible(True)
         self.ax.set_title(title)
         self.ax.set_xlabel(xlabel)
         self.ax.set_ylabel(ylabel)
-        self.ax.set_xticks(range(len(values)))
         self.ax.set_xticklabels(display_labels, rotation=45, ha="right")
-        self.fig.tight_layout()
+        if rebuild:
+            self.fig.tight_layout()
         self.canvas.draw_idle()
 
-    def read_names_sorted(self) -> tuple[list[str], str]:
-        # Reutiliza la función existente; captura salida y guarda nombres en memoria
-        if not self.selected_file:
-            return [], ""
+    def show_view(self, view: ViewResult, keep_position: bool = False) -> None:
+        if isinstance(view.content, str):
+            self.output_message(view.content, keep_position)
+        else:
+            self.output_rows(view.content, keep_position)
+        if view.chart:
+            self.plot_bar(*view.chart)
+        else:
+            self.clear_chart()
+        if view.kind is not None:
+            self.last_view_kind = view.kind
+
+    def load_analysis(self, worker: Worker, path: str,
+                      cached_entries: list[tuple[FileKey, FileAnalysis]]) -> LoadResult:
+        # Valida, ordena y analiza el archivo (o lo toma de la copia del caché); el informe se arma a
+        # partir del resultado estructurado. Corre en el hilo de trabajo: no toca el caché ni self
+        if not path:
+            return LoadResult(FileAnalysis([], []))
         
-        # Capturar la salida de la función
-        output_buffer = io.StringIO()
-        with contextlib.redirect_stdout(output_buffer):
-            names = ordenar_nombres_alfabeticamente(self.selected_file)
+        try:
+            stat = os.stat(path)
+            if stat.st_size == 0:
+                return LoadResult(FileAnalysis([], [f"[ERROR] El archivo '{path}' está vacío."]))
+            cached = find_cached(cached_entries, path, stat)
+            if cached is not None:
+                key, analysis = cached
+                return LoadResult(analysis, key, True)
+            hasher = new_hasher()
+            reader = LineReader(path, worker, hasher)
+            result = validar_nombres(reader)
+        except UnicodeDecodeError as e:
+            return LoadResult(FileAnalysis([], [f"[ERROR] No se pudo decodificar el archivo '{path}'.\n"
+                                                f"   Error de codificación: {e}\n"
+                                                "   El archivo puede estar en una codificación diferente a UTF-8."]))
+        except OSError as e:
+            return LoadResult(FileAnalysis([], [f"[ERROR] Error del sistema operativo al acceder al archivo '{path}': {e}"]))
         
-        output_text = output_buffer.getvalue()
-        self.loaded_names = names
-        return names, output_text
+        if not result.cantidad_no_vacias:
+            return LoadResult(FileAnalysis([], [f"[ERROR] El archivo '{path}' no contiene datos válidos.\n"
+                                                "   El archivo puede contener solo líneas vacías o espacios en blanco."]))
+        
+        report = result.reporte()
+        if not result.validos:
+            report.append(f"[ERROR] No se encontraron nombres válidos en el archivo '{path}'.")
+            return LoadResult(FileAnalysis([], report))
+        
+        # Cada nombre se analiza una sola vez; todas las vistas salen de una pasada sobre los registros
+        worker.report(None)
+        names = sorted(map(RegistroNombre, result.validos), key=clave_alfabetica)
+        worker.check_cancelled()
+        analysis = FileAnalysis(names, report)
+        # Hasta dónde se leyó, para que el modo seguimiento continúe desde ahí
+        analysis.offset = reader.offset
+        analysis.line_count = result.total_lineas
+        analysis.ends_with_newline = reader.ends_with_newline
+        analysis.hasher = hasher
+        analysis.invalid_count = result.cantidad_invalidos
+        analysis.invalid_examples = [line for _, line in result.invalidos[:REPORT_EXAMPLES]]
+        # Las vistas derivadas (más comunes, orden por longitud, índice de prefijos) se arman
+        # aquí, una vez por carga del archivo, y no al mostrarlas
+        analysis.build_views(CHART_MAX_BARS - 1)
+        key = FileKey(path, stat.st_size, stat.st_mtime_ns, hasher.digest())
+        # Si el archivo cambió mientras se leía, el hash no corresponde a la clave: no se guarda
+        return LoadResult(analysis, key, os.stat(path).st_mtime_ns == stat.st_mtime_ns)
+
+    def start_load(self, description: str, on_ready: Callable[[FileAnalysis], None]) -> None:
+        # La ruta y la copia del caché se toman aquí, en el hilo de Tk, antes de lanzar la carga
+        path = self.selected_file
+        cached_entries = self.analysis_cache.snapshot()
+        self.run_in_background(description, lambda worker: self.load_analysis(worker, path, cached_entries),
+                               lambda result: on_ready(self.finish_load(result)))
+
+    def finish_load(self, result: LoadResult) -> FileAnalysis:
+        # En el hilo de Tk: se guarda en el caché (store también lo marca como usado) y se asigna
+        if result.key is not None:
+            if result.cacheable:
+                self.analysis_cache.store(result.key, result.analysis)
+            self.analysis = result.analysis
+            self.analysis_key = result.key
+        return result.analysis
+
+
+    def with_analysis(self, description: str, on_ready: Callable[[FileAnalysis], None]) -> None:
+        # Si el análisis cargado sigue vigente se usa en el acto; si no, se carga en segundo plano.
+        # En modo seguimiento el análisis se mantiene al día con poll_tail
+        if self.follow_var.get() and self.analysis is not None:
+            on_ready(self.analysis)
+            return
+        key = self.analysis_key
+        if key is not None and self.selected_file:
+            try:
+                if key.matches(self.selected_file, os.stat(self.selected_file)):
+                    on_ready(self.analysis)
+                    return
+            except OSError:
+                pass
+        self.start_load(description, on_ready)
+
+    # Modo seguimiento: el archivo crece por el final (lo escribe otro proceso)
+    def toggle_follow(self) -> None:
+        if self.tail_job is not None:
+            self.after_cancel(self.tail_job)
+            self.tail_job = None
+        if self.follow_var.get():
+            self.poll_tail()
+
+    def poll_tail(self) -> None:
+        # Revisión barata: un stat por intervalo; solo se lee el archivo si creció
+        self.tail_job = self.after(TAIL_POLL_MS, self.poll_tail)
+        analysis = self.analysis
+        path = self.selected_file
+        if analysis is None or not path or self.is_busy():
+            return
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return
+        if size == analysis.offset:
+            return
+        if size < analysis.offset or not analysis.ends_with_newline or not analysis.names:
+            # Archivo truncado o rotado, última línea leída a medias o sin datos válidos: se relee entero
+            self.analysis_cache.discard(analysis)
+            self.analysis = None
+            self.analysis_key = None
+            self.refresh_view("Releyendo archivo...")
+            return
+        self.run_in_background("Leyendo líneas nuevas...", lambda worker: self.read_tail(worker, path, analysis),
+                               lambda result: self.apply_tail(analysis, result))
+
+    def read_tail(self, worker: Worker, path: str, analysis: FileAnalysis) -> TailResult | None:
+        # Corre en el hilo de trabajo: lee solo las líneas completas agregadas y arma un análisis nuevo
+        # (listas mezcladas, frecuencias, índice y vistas derivadas) sin modificar el que se está mostrando
+        hasher = analysis.hasher.copy()
+        reader = LineReader(path, worker, hasher, start=analysis.offset, complete_only=True)
+        result = validar_nombres(reader, primera_linea=analysis.line_count + 1)
+        if reader.offset == analysis.offset:
+            # Solo hay una línea a medio escribir: se lee en la próxima revisión
+            return None
+        mtime_ns = os.stat(path).st_mtime_ns
+        worker.report(None)
+        names = sorted(map(RegistroNombre, result.validos), key=clave_alfabetica)
+        worker.check_cancelled()
+        invalid_count = analysis.invalid_count + result.cantidad_invalidos
+        invalid_examples = analysis.invalid_examples[:]
+        missing = REPORT_EXAMPLES - len(invalid_examples)
+        if missing > 0:
+            invalid_examples.extend(line for _, line in result.invalidos[:missing])
+        report = lineas_advertencia(invalid_count, invalid_examples, len(analysis.names) + len(names), REPORT_EXAMPLES)
+        extended = analysis.extended(names, report)
+        extended.offset = reader.offset
+        extended.line_count = analysis.line_count + result.total_lineas
+        extended.hasher = hasher
+        extended.invalid_count = invalid_count
+        extended.invalid_examples = invalid_examples
+        # La clave del caché pasa a describir el contenido leído hasta ahora
+        key = FileKey(path, reader.offset, mtime_ns, hasher.digest())
+        return TailResult(extended, key, len(names), result.total_lineas)
+
+    def apply_tail(self, analysis: FileAnalysis, tail: TailResult | None) -> None:
+        # En el hilo de Tk solo se reemplaza el análisis por el ya armado y se vuelve a mostrar la vista
+        if tail is None or self.analysis is not analysis:
+            return
+        self.analysis_cache.discard(analysis)
+        self.analysis_cache.store(tail.key, tail.analysis)
+        self.analysis = tail.analysis
+        self.analysis_key = tail.key
+        self.lbl_status.config(text=f"+{tail.added} nombres ({tail.line_count} líneas nuevas)")
+        self.refresh_view(keep_position=True)
+
+    def refresh_view(self, description: str = "", keep_position: bool = False) -> None:
+        # Vuelve a mostrar la última vista con el análisis actual (o lo carga si no hay)
+        kind = self.last_view_kind
+        if kind == "search":
+            self.action_search()
+            return
+        views = {"alpha": self.view_sort_alpha, "freq": self.view_frequency,
+                 "filter": self.view_filter_long_first, "len": self.view_sort_by_first_len}
+        view = views.get(kind)
+        if view is not None:
+            self.with_analysis(description, lambda analysis: self.show_view(view(analysis), keep_position))
 
-    # Acciones
+    # Acciones: cada vista sale del análisis del archivo (view_*) y se muestra en el hilo de Tk
     def action_sort_alpha(self) -> None:
         if not self.ensure_file():
             return
-        names, log_output = self.read_names_sorted()
+        self.with_analysis("Leyendo y ordenando nombres...", lambda analysis: self.show_view(self.view_sort_alpha(analysis)))
+
+    def view_sort_alpha(self, analysis: FileAnalysis) -> ViewResult:
+        names = analysis.names
+        log_lines = list(analysis.report)
+        if names:
+            log_lines.append("[EXITO] Nombres ordenados alfabéticamente:")
+            log_lines.append("=" * 40)
+        log_output = "\n".join(log_lines)
         
         # Mostrar siempre el log capturado (contiene información útil sobre errores)
-        if log_output.strip():
-            self.output_message(log_output)
-        elif not names:
+        if not log_output.strip() and not names:
             # Si no hay nombres ni log, mostrar mensaje genérico pero más útil
-            self.output_message("[ERROR] No se pudieron obtener nombres del archivo.\n\nPosibles causas:\n• El archivo está vacío\n• El archivo contiene solo espacios o líneas vacías\n• El archivo no tiene el formato correcto (debe ser 'Nombre Apellido')\n• Error de permisos o codificación del archivo")
-            self.clear_chart()
-            return
+            return ViewResult(None, "[ERROR] No se pudieron obtener nombres del archivo.\n\nPosibles causas:\n• El archivo está vacío\n• El archivo contiene solo espacios o líneas vacías\n• El archivo no tiene el formato correcto (debe ser 'Nombre Apellido')\n• Error de permisos o codificación del archivo")
         # Gráfico: conteo por inicial del primer nombre
-        initials = {}
-        for n in names:
-            first = (n.split()[0] if n.split() else "?")
-            key = first[0].upper() if first else "?"
-            initials[key] = initials.get(key, 0) + 1
+        initials = analysis.initials
         labels, values = zip(*sorted(initials.items(), key=lambda x: (-x[1], x[0]))) if initials else ([], [])
+        chart = None
         if labels:
-            self.plot_bar(list(labels), list(values), "Conteo por inicial (primer nombre)", "Inicial", "Cantidad")
-        else:
-            self.clear_chart()
-        self.last_view_kind = "alpha"
+            labels, values = top_with_others(labels, values)
+            chart = (labels, values, "Conteo por inicial (primer nombre)", "Inicial", "Cantidad")
+        if not names:
+            return ViewResult("alpha", log_output, chart)
+        # El listado se arma a medida que se muestra
+        rows = LazyRows(names, lambda idx, name: f"{idx+1:2d}. {name}", header=log_lines)
+        return ViewResult("alpha", rows, chart)
+
+    def action_search(self) -> None:
+        prefix = self.search_var.get()
+        if not prefix.strip():
+            self.lbl_search.config(text="")
+            return
+        if self.analysis is None:
+            if not self.selected_file:
+                self.lbl_search.config(text="Primero selecciona un archivo.")
+                return
+            if self.is_busy():
+                self.lbl_search.config(text="Cargando nombres...")
+                return
+            self.start_load("Cargando nombres para la búsqueda...",
+                            lambda _: self.action_search() if self.analysis is not None
+                            else self.lbl_search.config(text="No se pudieron obtener nombres."))
+            return
+        matches, total = self.analysis.prefix_index().buscar(prefix, limite=SEARCH_LIMIT)
+        self.lbl_search.config(text=f"{total} coincidencias" + (f" (mostrando {SEARCH_LIMIT})" if total > SEARCH_LIMIT else ""))
+        lines = [f"{name} ({count})" for name, count in matches]
+        self.output_message(f"Nombres que empiezan con '{prefix.strip()}':\n" + "\n".join(lines))
+        self.last_view_kind = "search"
 
     def action_frequency(self) -> None:
         if not self.ensure_file():
             return
-        if not self.loaded_names:
-            names, _ = self.read_names_sorted()
-        else:
-            names = self.loaded_names
-        if not names:
-            self.output_message("No se pudieron obtener nombres.")
-            self.clear_chart()
-            return
-        freq = contar_frecuencia_nombres(names)
-        sorted_items = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
-        lines = [f"{name}: {count}" for name, count in sorted_items]
-        self.output_message("Frecuencia de nombres:\n" + "\n".join(lines))
-        # Gráfico de barras de frecuencias
-        if sorted_items:
-            labels = [k for k, _ in sorted_items]
-            values = [v for _, v in sorted_items]
-            self.plot_bar(labels, values, "Frecuencia de primer nombre", "Nombre", "Frecuencia")
-        else:
-            self.clear_chart()
-        self.last_view_kind = "freq"
+        self.with_analysis("Calculando frecuencias...", lambda analysis: self.show_view(self.view_frequency(analysis)))
+
+    def view_frequency(self, analysis: FileAnalysis) -> ViewResult:
+        if not analysis.names:
+            return ViewResult(None, "No se pudieron obtener nombres.")
+        # El listado completo necesita todo ordenado; el gráfico, solo los más comunes (heap)
+        sorted_items = analysis.most_common()
+        rows = LazyRows(sorted_items, lambda _, item: f"{item[0]}: {item[1]}", header=["Frecuencia de nombres:"])
+        # Gráfico de barras de frecuencias: los más comunes y el resto agrupado en "Otros"
+        chart = None
+        distinct = len(analysis.counter)
+        if distinct:
+            top = analysis.top_common(CHART_MAX_BARS - 1 if distinct > CHART_MAX_BARS else CHART_MAX_BARS)
+            labels = [k for k, _ in top]
+            values = [v for _, v in top]
+            if len(top) < distinct:
+                labels.append("Otros")
+                values.append(len(analysis.names) - sum(values))
+            chart = (labels, values, "Frecuencia de primer nombre", "Nombre", "Frecuencia")
+        return ViewResult("freq", rows, chart)
 
     def action_export_freq(self) -> None:
         if not self.ensure_file():
             return
-        if not self.loaded_names:
-            names, _ = self.read_names_sorted()
-        else:
-            names = self.loaded_names
-        if not names:
+        self.with_analysis("Calculando frecuencias...", self.finish_export_freq)
+
+    def finish_export_freq(self, analysis: FileAnalysis) -> None:
+        if not analysis.names:
             messagebox.showerror("Error", "No se pudieron obtener nombres para exportar.")
             return
-        freq = contar_frecuencia_nombres(names)
+        freq = analysis.counter.frecuencias
         save_path = filedialog.asksaveasfilename(defaultextension=".txt", initialfile="frecuencia_nombres.txt",
                                                  filetypes=[("Texto", "*.txt")])
         if not save_path:
             return
-        ok = exportar_frecuencias_a_archivo(freq, save_path)
-        if ok:
-            messagebox.showinfo("Exportación", f"Frecuencias exportadas en:\n{save_path}")
-        else:
-            messagebox.showerror("Exportación", "No se pudo exportar el archivo.")
+        self.run_in_background("Exportando frecuencias...", lambda worker: exportar_frecuencias_a_archivo(freq, save_path),
+                               lambda ok: messagebox.showinfo("Exportación", f"Frecuencias exportadas en:\n{save_path}") if ok
+                               else messagebox.showerror("Exportación", "No se pudo exportar el archivo."))
 
     def action_filter_long_first(self) -> None:
         if not self.ensure_file():
             return
-        if not self.loaded_names:
-            names, _ = self.read_names_sorted()
-        else:
-            names = self.loaded_names
-        filtered = filtrar_nombres_largos(names, longitud_minima=4)
+        self.with_analysis("Filtrando nombres...", lambda analysis: self.show_view(self.view_filter_long_first(analysis)))
+
+    def view_filter_long_first(self, analysis: FileAnalysis) -> ViewResult:
+        filtered = analysis.filtered
         if not filtered:
-            self.output_message("No hay nombres que cumplan la condición.")
-            self.clear_chart()
-            return
-        lines = [f"{idx+1:2d}. {name} (primer nombre '{name.split()[0]}')" for idx, name in enumerate(filtered)]
-        self.output_message("Filtrado (primer nombre > 4):\n" + "\n".join(lines))
-        # Gráfico: usar el nombre completo en X y la longitud del primer nombre en Y
-        labels = [n for n in filtered]
-        values = [len(n.split()[0]) for n in filtered]
-        self.plot_bar(labels, values, "Longitud del primer nombre (filtrados)", "Nombre completo", "Longitud 1er nombre")
-        self.last_view_kind = "filter"
+            return ViewResult(None, "No hay nombres que cumplan la condición.")
+        rows = LazyRows(filtered, lambda idx, name: f"{idx+1:2d}. {name} (primer nombre '{name.nombre}')",
+                        header=[f"Filtrado (primer nombre > {FILTER_MIN_LENGTH}):"])
+        # Gráfico: histograma de la longitud del primer nombre de los filtrados
+        labels, values = bin_lengths([(length, count) for length, count in analysis.length_counts()
+                                      if length > FILTER_MIN_LENGTH])
+        chart = (labels, values, "Longitud del primer nombre (filtrados)", "Longitud 1er nombre", "Cantidad de nombres")
+        return ViewResult("filter", rows, chart)
 
     def action_sort_by_first_len(self) -> None:
         if not self.ensure_file():
             return
-        if not self.loaded_names:
-            names, _ = self.read_names_sorted()
-        else:
-            names = self.loaded_names
-        sorted_by_len = ordenar_por_longitud_descendente(names)
-        lines = [
-            f"{idx+1:2d}. {name} (len 1er nombre: {len(name.split()[0])})" for idx, name in enumerate(sorted_by_len)
-        ]
-        self.output_message("Ordenado por longitud del primer nombre (desc):\n" + "\n".join(lines))
-        # Gráfico: top 15 por longitud del primer nombre usando nombre completo en X
-        top = sorted_by_len[:15]
-        labels = [n for n in top]
-        values = [len(n.split()[0]) for n in top]
-        self.plot_bar(labels, values, "Top 15 longitudes del primer nombre", "Nombre completo", "Longitud 1er nombre")
-        self.last_view_kind = "len"
+        self.with_analysis("Ordenando por longitud...", lambda analysis: self.show_view(self.view_sort_by_first_len(analysis)))
+
+    def view_sort_by_first_len(self, analysis: FileAnalysis) -> ViewResult:
+        # Las cubetas por longitud ya se armaron al analizar el archivo
+        sorted_by_len = analysis.sorted_by_length()
+        footer = []
+        if analysis.names:
+            lengths = analysis.lengths()
+            footer.append("")
+            footer.append(f"Longitud máxima: {lengths[0]} | mínima: {lengths[-1]} | "
+                          f"promedio: {analysis.length_sum / len(analysis.names):.1f}")
+        rows = LazyRows(sorted_by_len, lambda idx, name: f"{idx+1:2d}. {name} (len 1er nombre: {name.longitud_nombre})",
+                        header=["Ordenado por longitud del primer nombre (desc):"], footer=footer)
+        # Gráfico: distribución de nombres por longitud del primer nombre (directo de las cubetas)
+        labels, values = bin_lengths(analysis.length_counts())
+        chart = (labels, values, "Distribución por longitud del primer nombre", "Longitud 1er nombre", "Cantidad de nombres")
+        return ViewResult("len", rows, chart)
+
+
+def measure_startup() -> None:
+    # Crea la ventana, espera a que se dibuje y mide también el primer gráfico; después la cierra
+    window_start = time.perf_counter()
+    app = App(warm_up_charts=False)
+    window_end = time.perf_counter()
+    app.update_idletasks()
+    app.wait_visibility()
+    app.update()
+    painted = time.perf_counter()
+    chart_start = time.perf_counter()
+    app.ensure_chart()
+    app.update()
+    chart_end = time.perf_counter()
+    app.destroy()
+
+    print("Tiempos de inicio:")
+    for label, seconds in (("Importación de módulos", IMPORT_END - IMPORT_START),
+                           ("Creación de la ventana", window_end - window_start),
+                           ("Primer pintado", painted - window_end),
+                           ("Ventana visible (total)", painted - IMPORT_START),
+                           ("Primer gráfico (matplotlib)", chart_end - chart_start)):
+        print(f"  {label + ':':<30}{seconds * 1000:8.1f} ms")
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Interfaz gráfica para procesar archivos de nombres.")
+    parser.add_argument("--medir-inicio", action="store_true",
+                        help="Mide los tiempos de importación, primer pintado y primer gráfico, y cierra la ventana")
+    args = parser.parse_args()
+    if args.medir_inicio:
+        measure_startup()
+        return
     app = App()
     app.mainloop()
 
@@ -0,0 +1,159 @@
+import tkinter as tk
+from tkinter import font as tkfont, ttk
+from typing import Any, Callable, Sequence
+
+# Filas que avanza cada paso de la rueda del mouse
+WHEEL_ROWS = 3
+
+
+class LazyRows(Sequence[str]):
+    """
+    Filas de texto que se arman recién cuando se muestran: unas líneas de
+    encabezado fijas, una fila por elemento formateada con
+    format_row(posición, elemento) y unas líneas de pie fijas.
+    No copia los elementos ni guarda el texto.
+    """
+
+    def __init__(self, items: Sequence[Any], format_row: Callable[[int, Any], str],
+                 header: Sequence[str] = (), footer: Sequence[str] = ()) -> None:
+        self.items = items
+        self.format_row = format_row
+        self.header = list(header)
+        self.footer = list(footer)
+
+    def __len__(self) -> int:
+        return len(self.header) + len(self.items) + len(self.footer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        if index < len(self.header):
+            return self.header[index]
+        position = index - len(self.header)
+        if position >= len(self.items):
+            return self.footer[position - len(self.items)]
+        return self.format_row(position, self.items[position])
+
+
+class VirtualListView(tk.Frame):
+    """
+    Lista de solo lectura que muestra en un Text únicamente las filas visibles
+    de una secuencia (lista o LazyRows). El desplazamiento se calcula sobre el
+    total de filas, así mostrar un millón de filas cuesta lo mismo que mostrar
+    una pantalla. Incluye paginación e ir a una fila.
+    """
+
+    def __init__(self, master: tk.Misc, height: int = 25, width: int = 80) -> None:
+        super().__init__(master)
+        self.rows: Sequence[str] = ()
+        self.first = 0
+
+        body = tk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True)
+        self.text = tk.Text(body, wrap=tk.NONE, height=height, width=width, state=tk.DISABLED)
+        self.vbar = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self.on_scrollbar)
+        hbar = ttk.Scrollbar(body, orient=tk.HORIZONTAL, command=self.text.xview)
+        self.text.config(xscrollcommand=hbar.set)
+        self.text.grid(row=0, column=0, sticky="nsew")
+        self.vbar.grid(row=0, column=1, sticky="ns")
+        hbar.grid(row=1, column=0, sticky="ew")
+        body.rowconfigure(0, weight=1)
+        body.columnconfigure(0, weight=1)
+
+        # Paginación e ir a fila
+        nav = tk.Frame(self)
+        nav.pack(fill=tk.X, pady=(5, 0))
+        tk.Button(nav, text="<<", command=lambda: self.scroll_to(0)).pack(side=tk.LEFT)
+        tk.Button(nav, text="<", command=lambda: self.scroll_pages(-1)).pack(side=tk.LEFT)
+        tk.Button(nav, text=">", command=lambda: self.scroll_pages(1)).pack(side=tk.LEFT)
+        tk.Button(nav, text=">>", command=lambda: self.scroll_to(len(self.rows))).pack(side=tk.LEFT)
+        tk.Label(nav, text="Ir a fila:").pack(side=tk.LEFT, padx=(10, 0))
+        self.row_var = tk.StringVar()
+        row_entry = tk.Entry(nav, textvariable=self.row_var, width=10)
+        row_entry.pack(side=tk.LEFT, padx=5)
+        row_entry.bind("<Return>", lambda _: self.go_to_row())
+        tk.Button(nav, text="Ir", command=self.go_to_row).pack(side=tk.LEFT)
+        self.lbl_position = tk.Label(nav, text="", anchor="e")
+        self.lbl_position.pack(side=tk.RIGHT)
+
+        self.text.bind("<Configure>", lambda _: self.render())
+        self.text.bind("<MouseWheel>", self.on_wheel)
+        self.text.bind("<Button-4>", lambda _: self.scroll_rows(-WHEEL_ROWS))
+        self.text.bind("<Button-5>", lambda _: self.scroll_rows(WHEEL_ROWS))
+        self.text.bind("<Up>", lambda _: self.scroll_rows(-1))
+        self.text.bind("<Down>", lambda _: self.scroll_rows(1))
+        self.text.bind("<Prior>", lambda _: self.scroll_pages(-1))
+        self.text.bind("<Next>", lambda _: self.scroll_pages(1))
+        self.text.bind("<Control-Home>", lambda _: self.scroll_to(0))
+        self.text.bind("<Control-End>", lambda _: self.scroll_to(len(self.rows)))
+        # El Text deshabilitado no toma el foco solo; sin foco no llegan las teclas
+        self.text.bind("<Button-1>", lambda _: self.text.focus_set())
+
+    def set_rows(self, rows: Sequence[str], keep_position: bool = False) -> None:
+        # keep_position: mismas filas actualizadas (por ejemplo, con nombres nuevos), sin volver al principio
+        self.rows = rows
+        if not keep_position:
+            self.first = 0
+            self.text.xview_moveto(0)
+        self.render()
+
+    def visible_count(self) -> int:
+        height = self.text.winfo_height()
+        if height <= 1:
+            # Todavía no se dibujó: usar la altura pedida en líneas
+            return int(self.text.cget("height"))
+        line_height = tkfont.nametofont(self.text.cget("font")).metrics("linespace")
+        return max(1, height // line_height)
+
+    def render(self) -> None:
+        total = len(self.rows)
+        count = self.visible_count()
+        self.first = max(0, min(self.first, total - count))
+        last = min(total, self.first + count)
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", "\n".join(self.rows[self.first:last]))
+        self.text.config(state=tk.DISABLED)
+        if total:
+            self.vbar.set(self.first / total, last / total)
+            self.lbl_position.config(text=f"Filas {self.first + 1}-{last} de {total}")
+        else:
+            self.vbar.set(0, 1)
+            self.lbl_position.config(text="")
+
+    def scroll_to(self, row: int) -> str:
+        self.first = row
+        self.render()
+        # "break" evita el comportamiento por defecto del Text en los atajos de teclado
+        return "break"
+
+    def scroll_rows(self, amount: int) -> str:
+        return self.scroll_to(self.first + amount)
+
+    def scroll_pages(self, amount: int) -> str:
+        return self.scroll_rows(amount * self.visible_count())
+
+    def on_wheel(self, event: tk.Event) -> str:
+        # Windows usa múltiplos de 120; macOS, valores pequeños
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll_rows(-steps * WHEEL_ROWS)
+
+    def on_scrollbar(self, action: str, amount: str, unit: str | None = None) -> None:
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.rows)))
+        elif unit == "pages":
+            self.scroll_pages(int(amount))
+        else:
+            self.scroll_rows(int(amount))
+
+    def go_to_row(self) -> None:
+        try:
+            row = int(self.row_var.get())
+        except ValueError:
+            self.bell()
+            return
+        self.scroll_to(row - 1)
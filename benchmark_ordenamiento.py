@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import random
+import time
+
+# Importar la clave de ordenación, su caché y el camino Unicode original de ordenar_nombres.py
+from ordenar_nombres import limpiar_cache_claves, normalizar_para_ordenar, _normalizar_no_ascii, _normalizar_unicode
+
+# Sílabas para inventar apellidos cuando se piden más nombres distintos que los de archivo_base
+SILABAS = ("ma", "ri", "ño", "gon", "zá", "lez", "ro", "dri", "guez", "pé", "tor", "res", "bel", "ca", "sa", "lú")
+
+def clave_sin_optimizar(texto):
+    """
+    Clave de ordenación original: NFD + unicodedata.category por carácter, sin caché.
+    """
+    return _normalizar_unicode(texto).lower()
+
+def generar_nombres(cantidad, archivo_base="nombres.txt", semilla=42, distintos=None):
+    """
+    Genera una lista de nombres combinando al azar los nombres y apellidos
+    de archivo_base, para simular archivos grandes.
+
+    Sin distintos, solo se combinan los de archivo_base (pocos cientos de
+    nombres distintos, muchas repeticiones). Con distintos se arma primero un
+    conjunto de esa cantidad de nombres distintos, agregando un segundo
+    apellido inventado con sílabas, y se eligen de ahí.
+    """
+    with open(archivo_base, 'r', encoding='utf-8') as archivo:
+        pares = [linea.split() for linea in archivo if len(linea.split()) >= 2]
+    primeros = [par[0] for par in pares]
+    apellidos = [par[-1] for par in pares]
+    aleatorio = random.Random(semilla)
+    if not distintos:
+        return [f"{aleatorio.choice(primeros)} {aleatorio.choice(apellidos)}" for _ in range(cantidad)]
+
+    # Un dict (no un set) conserva el orden de generación: con la misma semilla, los mismos nombres
+    vistos = {}
+    while len(vistos) < distintos:
+        inventado = "".join(aleatorio.choice(SILABAS) for _ in range(aleatorio.randint(2, 4))).capitalize()
+        vistos[f"{aleatorio.choice(primeros)} {aleatorio.choice(apellidos)} {inventado}"] = None
+    disponibles = list(vistos)
+    if cantidad <= distintos:
+        return disponibles[:cantidad]
+    return disponibles + [aleatorio.choice(disponibles) for _ in range(cantidad - distintos)]
+
+def medir(nombres, clave):
+    """
+    Mide por separado el cálculo de claves y el ordenamiento completo, los dos
+    con la caché de claves vacía: así el cálculo de claves es la parte que le
+    toca a las claves dentro de un ordenamiento en frío.
+    """
+    limpiar_cache_claves()
+    inicio = time.perf_counter()
+    for nombre in nombres:
+        clave(nombre)
+    tiempo_claves = time.perf_counter() - inicio
+
+    limpiar_cache_claves()
+    inicio = time.perf_counter()
+    sorted(nombres, key=clave)
+    tiempo_orden = time.perf_counter() - inicio
+    return tiempo_claves, tiempo_orden
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara la clave de ordenación original con la optimizada.")
+    parser.add_argument("--cantidad", type=int, default=1_000_000, help="Cantidad de nombres (p. ej. 10000000)")
+    parser.add_argument("--distintos", type=int, default=None,
+                        help="Cantidad de nombres distintos (por defecto, solo combinaciones de nombres.txt)")
+    args = parser.parse_args()
+
+    print(f"Generando {args.cantidad} nombres...")
+    nombres = generar_nombres(args.cantidad, distintos=args.distintos)
+    print(f"Nombres distintos: {len(set(nombres))}")
+
+    print("Benchmark de claves de ordenación:")
+    print("=" * 50)
+    for etiqueta, clave in (("Original (NFD por nombre)", clave_sin_optimizar),
+                            ("Optimizada (ASCII + tabla + LRU adaptativa)", normalizar_para_ordenar)):
+        tiempo_claves, tiempo_orden = medir(nombres, clave)
+        print(f"{etiqueta}:")
+        print(f"  Cálculo de claves (en frío): {tiempo_claves:.2f} s")
+        print(f"  Ordenamiento completo (en frío): {tiempo_orden:.2f} s "
+              f"(claves = {100 * tiempo_claves / tiempo_orden:.0f}% del tiempo)")
+    print(f"Caché de claves con acentos: {_normalizar_no_ascii.cache_info()}")
@@ -1,40 +1,204 @@
 # -*- coding: utf-8 -*-
 
+import argparse
+import io
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+# Importar la división en bloques alineados a saltos de línea de validacion_paralela.py
+from validacion_paralela import BLOQUES_POR_PROCESO, TAMANO_MINIMO_BLOQUE, calcular_bloques
+
+# Palabras que se mantienen en minúsculas si no se indican otras
+EXCEPCIONES_POR_DEFECTO = ("y", "el", "la", "en", "de", "del", "con", "por", "para", "un", "una", "los", "las")
+# Palabras distintas cuya transformación se recuerda en cada Capitalizador
+TAMANO_CACHE_PALABRAS = 1 << 14
+# Espacios entre palabras; el grupo hace que re.split los conserve
+_ESPACIOS = re.compile(r'(\s+)')
+# Tamaño máximo de cada bloque en modo archivo (limita la memoria de cada proceso)
+TAMANO_MAXIMO_BLOQUE = 8 * 1024 * 1024
+# Líneas que se escriben juntas en el modo secuencial
+LINEAS_POR_LOTE = 10000
+
+class Capitalizador:
+    """
+    Capitalizador reutilizable: las excepciones se guardan una sola vez en un
+    frozenset y el resultado de cada palabra se recuerda en una caché LRU
+    acotada, porque en los títulos las mismas palabras se repiten constantemente.
+    Conviene crear uno y usarlo para todos los títulos de un trabajo.
+
+    Attributes:
+        excepciones (frozenset): Palabras que se mantienen en minúsculas
+        tamano_cache (int): Cantidad máxima de palabras distintas en la caché
+    """
+
+    def __init__(self, palabras_excepciones=None, tamano_cache=TAMANO_CACHE_PALABRAS):
+        if palabras_excepciones is None:
+            palabras_excepciones = EXCEPCIONES_POR_DEFECTO
+        self.excepciones = frozenset(palabras_excepciones)
+        self.tamano_cache = tamano_cache
+        # Caché propia de cada instancia (las excepciones cambian el resultado)
+        self.capitalizar_palabra = lru_cache(maxsize=tamano_cache)(self._transformar_palabra)
+
+    def __reduce__(self):
+        # Para enviarlo a otros procesos: la caché no se copia, se vuelve a crear vacía
+        return (Capitalizador, (tuple(self.excepciones), self.tamano_cache))
+
+    def _transformar_palabra(self, palabra):
+        # Limpiar la palabra de signos de puntuación para la comparación
+        palabra_limpia = palabra.lower().strip(".,;:!?()[]{}'\"")
+        
+        # Solo capitalizar si no está en excepciones
+        if palabra_limpia not in self.excepciones:
+            # Capitalizar manteniendo signos de puntuación
+            return palabra.capitalize()
+        # Mantener en minúsculas
+        return palabra.lower()
+
+    def capitalizar(self, texto):
+        """
+        Capitaliza un texto como capitalizar_titulo (los espacios se normalizan a uno).
+        """
+        return " ".join(map(self.capitalizar_palabra, texto.split()))
+
+    def capitalizar_linea(self, linea):
+        """
+        Capitaliza un texto conservando los espacios originales
+        (incluidos los del principio, los del final y el salto de línea).
+        """
+        partes = _ESPACIOS.split(linea)
+        capitalizar_palabra = self.capitalizar_palabra
+        # Las posiciones pares son palabras (o '' en los extremos) y las impares, espacios
+        for i in range(0, len(partes), 2):
+            if partes[i]:
+                partes[i] = capitalizar_palabra(partes[i])
+        return "".join(partes)
+
+    def capitalizar_muchos(self, textos, conservar_espacios=False):
+        """
+        Capitaliza muchos textos de una vez, reutilizando la caché entre todos.
+
+        Args:
+            textos (iterable): Textos a capitalizar (se recorre una sola vez)
+            conservar_espacios (bool): Si es True, se usa capitalizar_linea
+
+        Returns:
+            generator: Los textos capitalizados, en el mismo orden
+        """
+        capitalizar = self.capitalizar_linea if conservar_espacios else self.capitalizar
+        return map(capitalizar, textos)
+
+# Instancia compartida para las llamadas con las excepciones por defecto
+_CAPITALIZADOR_POR_DEFECTO = Capitalizador()
+
+def _obtener_capitalizador(palabras_excepciones):
+    if palabras_excepciones is None:
+        return _CAPITALIZADOR_POR_DEFECTO
+    return Capitalizador(palabras_excepciones)
+
 def capitalizar_titulo(texto, palabras_excepciones=None):
     """
     Capitaliza la primera letra de cada palabra en un texto, excepto para
     palabras específicas que se mantienen en minúsculas.
+    Para muchos títulos conviene usar directamente un Capitalizador.
     
     Args:
         texto (str): El texto a capitalizar
         palabras_excepciones (list): Lista de palabras que no se capitalizarán
-                                   (por defecto: ["y", "el", "la", "en", "de", "del", "con", "por", "para"])
+                                   (por defecto: EXCEPCIONES_POR_DEFECTO)
     
     Returns:
         str: El texto capitalizado según las reglas especificadas
     """
-    if palabras_excepciones is None:
-        palabras_excepciones = ["y", "el", "la", "en", "de", "del", "con", "por", "para", "un", "una", "los", "las"]
-    
-    # Dividir el texto en palabras
-    palabras = texto.split()
-    palabras_capitalizadas = []
-    
-    for i, palabra in enumerate(palabras):
-        # Limpiar la palabra de signos de puntuación para la comparación
-        palabra_limpia = palabra.lower().strip(".,;:!?()[]{}'\"")
-        
-        # Solo capitalizar si no está en excepciones
-        if palabra_limpia not in palabras_excepciones:
-            # Capitalizar manteniendo signos de puntuación
-            palabra_capitalizada = palabra.capitalize()
-        else:
-            # Mantener en minúsculas
-            palabra_capitalizada = palabra.lower()
-        
-        palabras_capitalizadas.append(palabra_capitalizada)
-    
-    return " ".join(palabras_capitalizadas)
+    return _obtener_capitalizador(palabras_excepciones).capitalizar(texto)
+
+def capitalizar_linea(linea, palabras_excepciones=None):
+    """
+    Igual que capitalizar_titulo, pero conserva los espacios originales
+    (incluidos los del principio, los del final y el salto de línea).
+    """
+    return _obtener_capitalizador(palabras_excepciones).capitalizar_linea(linea)
+
+def _capitalizar_bloque(argumentos):
+    """
+    Trabajo de cada proceso: capitaliza las líneas de un bloque de bytes.
+    Devuelve el texto resultante y la cantidad de líneas.
+    """
+    archivo_entrada, inicio, fin, capitalizador = argumentos
+    with open(archivo_entrada, 'rb') as archivo:
+        archivo.seek(inicio)
+        texto = archivo.read(fin - inicio).decode('utf-8')
+    # Mismos cortes que la lectura secuencial con newline='' ('\n', '\r\n' y '\r');
+    # splitlines también cortaría en '\x0c', '\x85', '\u2028' y otros separadores
+    lineas = list(io.StringIO(texto, newline=''))
+    return "".join(capitalizador.capitalizar_muchos(lineas, conservar_espacios=True)), len(lineas)
+
+def _capitalizar_secuencial(archivo_entrada, salida, capitalizador):
+    cantidad = 0
+    with open(archivo_entrada, 'r', encoding='utf-8', newline='') as entrada:
+        while True:
+            lote = list(islice(entrada, LINEAS_POR_LOTE))
+            if not lote:
+                return cantidad
+            salida.write("".join(capitalizador.capitalizar_muchos(lote, conservar_espacios=True)))
+            cantidad += len(lote)
+
+def _capitalizar_paralelo(archivo_entrada, salida, capitalizador, procesos):
+    tamano = os.path.getsize(archivo_entrada)
+    cantidad_bloques = max(procesos * BLOQUES_POR_PROCESO, -(-tamano // TAMANO_MAXIMO_BLOQUE))
+    bloques = iter(calcular_bloques(archivo_entrada, cantidad_bloques))
+    # Ventana acotada de bloques en curso: si el primero tarda, no se acumulan
+    # en memoria los textos de todos los demás ya terminados
+    ventana = procesos * BLOQUES_POR_PROCESO
+    pendientes = deque()
+    cantidad = 0
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        for inicio, fin in islice(bloques, ventana):
+            pendientes.append(ejecutor.submit(_capitalizar_bloque, (archivo_entrada, inicio, fin, capitalizador)))
+        # Se escriben en el orden del archivo; por cada bloque escrito se envía el siguiente
+        while pendientes:
+            texto, lineas = pendientes.popleft().result()
+            salida.write(texto)
+            cantidad += lineas
+            for inicio, fin in islice(bloques, 1):
+                pendientes.append(ejecutor.submit(_capitalizar_bloque, (archivo_entrada, inicio, fin, capitalizador)))
+    return cantidad
+
+def capitalizar_archivo(archivo_entrada, archivo_salida=None, palabras_excepciones=None, procesos=None):
+    """
+    Capitaliza un archivo de títulos línea por línea, conservando los espacios
+    y los saltos de línea originales, sin cargarlo entero en memoria.
+
+    Los archivos grandes se dividen en bloques alineados a saltos de línea
+    que se procesan en un pool de procesos; los resultados se escriben en
+    el mismo orden que la entrada.
+
+    Args:
+        archivo_entrada (str): Archivo de títulos (UTF-8), uno por línea
+        archivo_salida (str): Archivo de salida (por defecto, la salida estándar)
+        palabras_excepciones (list): Igual que en capitalizar_titulo
+        procesos (int): Cantidad de procesos (por defecto, uno por núcleo; 1 = secuencial)
+
+    Returns:
+        int: Cantidad de líneas procesadas
+    """
+    capitalizador = _obtener_capitalizador(palabras_excepciones)
+    procesos = procesos or os.cpu_count() or 1
+    paralelo = procesos > 1 and os.path.getsize(archivo_entrada) > 2 * TAMANO_MINIMO_BLOQUE
+
+    salida = sys.stdout if archivo_salida is None else open(archivo_salida, 'w', encoding='utf-8', newline='')
+    try:
+        if paralelo:
+            return _capitalizar_paralelo(archivo_entrada, salida, capitalizador, procesos)
+        return _capitalizar_secuencial(archivo_entrada, salida, capitalizador)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
 
 def probar_funcion():
     """
@@ -108,11 +272,32 @@ def demostrar_excepciones():
     print(f"Excepciones personalizadas {excepciones}: {resultado3}")
 
 if __name__ == "__main__":
-    # Ejecutar las pruebas
-    probar_funcion()
-    demostrar_excepciones()
-    
-    print("\n" + "=" * 50)
-    print("Función lista para usar:")
-    print("capitalizar_titulo(texto, palabras_excepciones)")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(description="Capitaliza títulos; sin argumentos ejecuta la demostración.")
+    parser.add_argument("entrada", nargs="?", help="Archivo de títulos, uno por línea (UTF-8)")
+    parser.add_argument("salida", nargs="?", help="Archivo de salida (por defecto, la salida estándar)")
+    parser.add_argument("--excepciones", nargs="*", default=None, metavar="PALABRA",
+                        help="Palabras que no se capitalizan (por defecto, las de capitalizar_titulo)")
+    parser.add_argument("--procesos", type=int, default=None, help="Cantidad de procesos (por defecto, uno por núcleo)")
+    args = parser.parse_args()
+
+    if args.entrada is None:
+        # Ejecutar las pruebas
+        probar_funcion()
+        demostrar_excepciones()
+        
+        print("\n" + "=" * 50)
+        print("Función lista para usar:")
+        print("capitalizar_titulo(texto, palabras_excepciones)")
+        print("=" * 50)
+        raise SystemExit(0)
+
+    inicio = time.perf_counter()
+    try:
+        cantidad = capitalizar_archivo(args.entrada, args.salida, args.excepciones, args.procesos)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[ERROR] No se pudo procesar el archivo: {e}", file=sys.stderr)
+        raise SystemExit(1)
+    duracion = time.perf_counter() - inicio
+    velocidad = cantidad / duracion if duracion > 0 else 0
+    # El resumen va a stderr para no mezclarse con los títulos si se escriben en stdout
+    print(f"Líneas procesadas: {cantidad} en {duracion:.2f} s ({velocidad:,.0f} líneas/s)", file=sys.stderr)
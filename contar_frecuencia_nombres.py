@@ -1,17 +1,112 @@
 # -*- coding: utf-8 -*-
 
+import heapq
+
 # Importar la función para leer nombres del archivo ordenar_nombres.py
 from ordenar_nombres import ordenar_nombres_alfabeticamente
+from registro_nombre import primer_nombre as obtener_primer_nombre
 
 def contar_frecuencia_nombres(nombres):
-    frecuencia = {}
-    for nombre_completo in nombres:
-        primer_nombre = nombre_completo.split()[0]
-        if primer_nombre in frecuencia:
-            frecuencia[primer_nombre] += 1
-        else:
-            frecuencia[primer_nombre] = 1
-    return frecuencia
+    """
+    Cuenta cuántas veces aparece cada primer nombre.
+    
+    Args:
+        nombres (iterable): Nombres completos (str o RegistroNombre); puede ser una
+                            lista o un iterador como el que produce leer_nombres
+                            (se recorre una sola vez). Con una TablaNombres el
+                            conteo se resuelve vectorizado con np.bincount
+        
+    Returns:
+        dict: Diccionario con cada primer nombre y su frecuencia
+    """
+    if hasattr(nombres, "frecuencia_primer_nombre"):
+        return nombres.frecuencia_primer_nombre()
+    
+    return ContadorFrecuencias(nombres).frecuencias
+
+def _clave_frecuencia(item):
+    # Mayor frecuencia primero; a igual frecuencia, orden alfabético
+    return (-item[1], item[0])
+
+class ContadorFrecuencias:
+    """
+    Contador incremental de frecuencias de primer nombre.
+    
+    Se puede actualizar a medida que llegan nombres nuevos, fusionar con otros
+    contadores y consultar los k nombres más comunes con un heap, sin ordenar
+    todo el diccionario.
+    
+    Attributes:
+        frecuencias (dict): Primer nombre -> frecuencia
+        total (int): Cantidad de nombres contados
+    """
+    
+    def __init__(self, nombres=None):
+        self.frecuencias = {}
+        self.total = 0
+        if nombres is not None:
+            self.actualizar(nombres)
+    
+    def agregar(self, nombre_completo, cantidad=1):
+        """
+        Suma cantidad apariciones del primer nombre de nombre_completo.
+        """
+        primer_nombre = obtener_primer_nombre(nombre_completo)
+        self.frecuencias[primer_nombre] = self.frecuencias.get(primer_nombre, 0) + cantidad
+        self.total += cantidad
+    
+    def actualizar(self, nombres):
+        """
+        Cuenta un lote de nombres nuevos (cualquier iterable aceptado por contar_frecuencia_nombres).
+        """
+        if hasattr(nombres, "frecuencia_primer_nombre"):
+            return self.fusionar(nombres.frecuencia_primer_nombre())
+        frecuencias = self.frecuencias
+        for nombre_completo in nombres:
+            primer_nombre = obtener_primer_nombre(nombre_completo)
+            if primer_nombre in frecuencias:
+                frecuencias[primer_nombre] += 1
+            else:
+                frecuencias[primer_nombre] = 1
+            self.total += 1
+        return self
+    
+    def fusionar(self, otro):
+        """
+        Suma las frecuencias de otro ContadorFrecuencias o de un diccionario nombre -> frecuencia.
+        """
+        frecuencias = otro.frecuencias if isinstance(otro, ContadorFrecuencias) else otro
+        for primer_nombre, frecuencia in frecuencias.items():
+            self.frecuencias[primer_nombre] = self.frecuencias.get(primer_nombre, 0) + frecuencia
+            self.total += frecuencia
+        return self
+    
+    def copiar(self):
+        """
+        Copia independiente del contador, para sumarle nombres sin modificar el original.
+        """
+        copia = ContadorFrecuencias()
+        copia.frecuencias = dict(self.frecuencias)
+        copia.total = self.total
+        return copia
+    
+    def mas_comunes(self, k=None):
+        """
+        Devuelve los k nombres más comunes como tuplas (nombre, frecuencia), ordenados
+        por frecuencia descendente y luego alfabéticamente. Con k=None devuelve todos.
+        """
+        if k is None or k >= len(self.frecuencias):
+            return sorted(self.frecuencias.items(), key=_clave_frecuencia)
+        return heapq.nsmallest(k, self.frecuencias.items(), key=_clave_frecuencia)
+    
+    def __len__(self):
+        return len(self.frecuencias)
+    
+    def __getitem__(self, primer_nombre):
+        return self.frecuencias.get(primer_nombre, 0)
+    
+    def __add__(self, otro):
+        return ContadorFrecuencias().fusionar(self).fusionar(otro)
 
 if __name__ == '__main__':
     # Leer nombres del archivo nombres.txt usando la función de ordenar_nombres.py
@@ -19,10 +114,10 @@ if __name__ == '__main__':
     nombres = ordenar_nombres_alfabeticamente(archivo)
     
     if nombres:
-        resultado = contar_frecuencia_nombres(nombres)
+        contador = ContadorFrecuencias(nombres)
         # Mostrar frecuencias
         print("\nFrecuencia de nombres:")
         print("=" * 30)
-        frecuencias_ordenadas = sorted(resultado.items(), key=lambda x: (-x[1], x[0]))
+        frecuencias_ordenadas = contador.mas_comunes()
         for nombre, frecuencia in frecuencias_ordenadas:
             print(f"{nombre}: {frecuencia}")
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import math
+from array import array
+from hashlib import blake2b
+
+# Importar funciones de los archivos existentes
+from exportar_frecuencias import exportar_frecuencias_a_archivo
+from ordenar_nombres import leer_nombres
+from registro_nombre import primer_nombre as obtener_primer_nombre
+
+def _hash_doble(texto):
+    """
+    Dos hashes de 64 bits estables entre procesos y ejecuciones
+    (a diferencia de hash(), que cambia con PYTHONHASHSEED).
+    """
+    digest = blake2b(texto.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: estima frecuencias en memoria fija.
+
+    Con probabilidad 1 - delta, la estimación supera a la frecuencia real
+    en a lo sumo epsilon * total (nunca la subestima).
+    """
+
+    def __init__(self, epsilon=0.001, delta=0.01):
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon y delta deben estar entre 0 y 1")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.ancho = math.ceil(math.e / epsilon)
+        self.profundidad = math.ceil(math.log(1 / delta))
+        self.tabla = array('Q', bytes(8 * self.ancho * self.profundidad))
+        self.total = 0
+
+    def _posiciones(self, hashes):
+        h1, h2 = hashes
+        ancho = self.ancho
+        return [fila * ancho + (h1 + fila * h2) % ancho for fila in range(self.profundidad)]
+
+    def agregar(self, clave, cantidad=1, hashes=None):
+        tabla = self.tabla
+        for posicion in self._posiciones(hashes or _hash_doble(clave)):
+            tabla[posicion] += cantidad
+        self.total += cantidad
+
+    def estimar(self, clave, hashes=None):
+        tabla = self.tabla
+        return min(tabla[posicion] for posicion in self._posiciones(hashes or _hash_doble(clave)))
+
+    def fusionar(self, otro):
+        if (self.ancho, self.profundidad) != (otro.ancho, otro.profundidad):
+            raise ValueError("Solo se pueden fusionar sketches con los mismos parámetros")
+        tabla = self.tabla
+        for posicion, valor in enumerate(otro.tabla):
+            if valor:
+                tabla[posicion] += valor
+        self.total += otro.total
+        return self
+
+class HyperLogLog:
+    """
+    HyperLogLog: estima la cantidad de elementos distintos en memoria fija.
+    El error relativo típico es aproximadamente error_relativo.
+    """
+
+    def __init__(self, error_relativo=0.01):
+        if not 0 < error_relativo < 1:
+            raise ValueError("error_relativo debe estar entre 0 y 1")
+        self.precision = min(18, max(4, math.ceil(math.log2((1.04 / error_relativo) ** 2))))
+        self.cantidad_registros = 1 << self.precision
+        self.registros = bytearray(self.cantidad_registros)
+
+    def agregar(self, clave, hashes=None):
+        h1 = (hashes or _hash_doble(clave))[0]
+        bits_restantes = 64 - self.precision
+        indice = h1 >> bits_restantes
+        resto = h1 & ((1 << bits_restantes) - 1)
+        rango = bits_restantes - resto.bit_length() + 1
+        if rango > self.registros[indice]:
+            self.registros[indice] = rango
+
+    def estimar(self):
+        m = self.cantidad_registros
+        alfa = 0.7213 / (1 + 1.079 / m)
+        estimacion = alfa * m * m / sum(2.0 ** -registro for registro in self.registros)
+        ceros = self.registros.count(0)
+        # Corrección para cardinalidades pequeñas (conteo lineal)
+        if estimacion <= 2.5 * m and ceros:
+            estimacion = m * math.log(m / ceros)
+        return round(estimacion)
+
+    def fusionar(self, otro):
+        if self.precision != otro.precision:
+            raise ValueError("Solo se pueden fusionar HyperLogLog con la misma precisión")
+        self.registros = bytearray(map(max, self.registros, otro.registros))
+        return self
+
+class ContadorAproximado:
+    """
+    Conteo aproximado de primeros nombres para flujos sin límite:
+    frecuencias con Count-Min Sketch, cantidad de nombres distintos con
+    HyperLogLog y una lista acotada de candidatos a nombres más frecuentes
+    para poder exportar resultados. La memoria no crece con el flujo.
+
+    Args:
+        epsilon (float): Error máximo de frecuencia, como fracción del total de nombres
+        delta (float): Probabilidad de superar ese error
+        error_cardinalidad (float): Error relativo de la cantidad de nombres distintos
+        max_candidatos (int): Cantidad de nombres frecuentes que se conservan
+    """
+
+    def __init__(self, epsilon=0.001, delta=0.01, error_cardinalidad=0.01, max_candidatos=1000):
+        self.sketch = CountMinSketch(epsilon, delta)
+        self.distintos = HyperLogLog(error_cardinalidad)
+        self.max_candidatos = max_candidatos
+        self.candidatos = {}
+
+    @property
+    def total(self):
+        return self.sketch.total
+
+    def agregar(self, nombre_completo, cantidad=1):
+        """
+        Cuenta una aparición del primer nombre de nombre_completo.
+        """
+        primer_nombre = obtener_primer_nombre(nombre_completo)
+        hashes = _hash_doble(primer_nombre)
+        self.sketch.agregar(primer_nombre, cantidad, hashes)
+        self.distintos.agregar(primer_nombre, hashes)
+        self.candidatos[primer_nombre] = self.sketch.estimar(primer_nombre, hashes)
+        if len(self.candidatos) > 2 * self.max_candidatos:
+            self._recortar_candidatos()
+
+    def actualizar(self, nombres):
+        """
+        Cuenta un lote de nombres (cualquier iterable de str o RegistroNombre).
+        """
+        for nombre_completo in nombres:
+            self.agregar(nombre_completo)
+        return self
+
+    def _recortar_candidatos(self):
+        mayores = sorted(self.candidatos.items(), key=lambda x: (-x[1], x[0]))[:self.max_candidatos]
+        self.candidatos = dict(mayores)
+
+    def estimar(self, primer_nombre):
+        """
+        Frecuencia estimada de un primer nombre (cota superior con alta probabilidad).
+        """
+        return self.sketch.estimar(primer_nombre)
+
+    def cardinalidad(self):
+        """
+        Cantidad estimada de primeros nombres distintos.
+        """
+        return self.distintos.estimar()
+
+    def mas_comunes(self, k=None):
+        """
+        Los k nombres estimados como más frecuentes, como tuplas (nombre, frecuencia).
+        """
+        k = self.max_candidatos if k is None else min(k, self.max_candidatos)
+        estimaciones = ((nombre, self.sketch.estimar(nombre)) for nombre in self.candidatos)
+        return sorted(estimaciones, key=lambda x: (-x[1], x[0]))[:k]
+
+    def frecuencias(self, k=None):
+        """
+        Diccionario nombre -> frecuencia estimada, listo para exportar_frecuencias_a_archivo.
+        """
+        return dict(self.mas_comunes(k))
+
+    def fusionar(self, otro):
+        """
+        Combina con otro ContadorAproximado creado con los mismos parámetros.
+        """
+        self.sketch.fusionar(otro.sketch)
+        self.distintos.fusionar(otro.distintos)
+        for nombre in set(self.candidatos) | set(otro.candidatos):
+            self.candidatos[nombre] = self.sketch.estimar(nombre)
+        if len(self.candidatos) > self.max_candidatos:
+            self._recortar_candidatos()
+        return self
+
+def contar_frecuencia_aproximada(nombres, epsilon=0.001, delta=0.01, error_cardinalidad=0.01, max_candidatos=1000):
+    """
+    Versión aproximada y de memoria fija de contar_frecuencia_nombres.
+
+    Returns:
+        ContadorAproximado: Usar .frecuencias() para obtener el diccionario a exportar
+    """
+    return ContadorAproximado(epsilon, delta, error_cardinalidad, max_candidatos).actualizar(nombres)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Frecuencias aproximadas de primeros nombres en memoria fija.")
+    parser.add_argument("entrada", nargs="?", default="nombres.txt", help="Archivo de nombres")
+    parser.add_argument("salida", nargs="?", default="frecuencia_nombres_aproximada.txt", help="Archivo de salida")
+    parser.add_argument("--epsilon", type=float, default=0.001, help="Error máximo como fracción del total (por defecto 0.001)")
+    parser.add_argument("--delta", type=float, default=0.01, help="Probabilidad de superar el error (por defecto 0.01)")
+    parser.add_argument("--top", type=int, default=1000, help="Cantidad de nombres frecuentes a exportar")
+    args = parser.parse_args()
+
+    contador = contar_frecuencia_aproximada(leer_nombres(args.entrada), args.epsilon, args.delta,
+                                            max_candidatos=args.top)
+    print(f"Nombres procesados: {contador.total}")
+    print(f"Primeros nombres distintos (estimado): {contador.cardinalidad()}")
+    print(f"Error máximo por frecuencia: ±{math.ceil(args.epsilon * contador.total)} "
+          f"(probabilidad {1 - args.delta:.0%})")
+    exportar_frecuencias_a_archivo(contador.frecuencias(), args.salida)
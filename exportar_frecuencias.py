@@ -1,43 +1,232 @@
 # -*- coding: utf-8 -*-
 
+import csv
+import json
+import os
+import secrets
+import sqlite3
+import struct
+from itertools import islice
+
 # Importar las funciones de los archivos existentes
 from contar_frecuencia_nombres import contar_frecuencia_nombres
 from ordenar_nombres import ordenar_nombres_alfabeticamente
 
-def exportar_frecuencias_a_archivo(frecuencias, archivo_salida):
+# Cantidad de entradas que se arman en memoria antes de cada escritura
+TAMANO_LOTE = 50000
+# Cabecera del formato binario: firma + cantidad de entradas
+FIRMA_BINARIO = b"FRQ1"
+
+# Intentos de crear un archivo temporal con nombre al azar antes de rendirse
+INTENTOS_TEMPORAL = 100
+
+def _crear_temporal(carpeta):
+    """
+    Crea un archivo temporal vacío con nombre al azar en carpeta y devuelve su ruta.
+    Se crea con open(..., 'x'), así tiene los permisos habituales según la umask
+    del proceso (mkstemp usa 0600), sin tener que consultarla.
+    """
+    for _ in range(INTENTOS_TEMPORAL):
+        ruta = os.path.join(carpeta, f".exportando_{secrets.token_hex(8)}")
+        try:
+            with open(ruta, 'x'):
+                return ruta
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No se pudo crear un archivo temporal en '{carpeta}'")
+
+def _sincronizar(ruta):
+    """
+    Fuerza a disco el contenido de un archivo antes de renombrarlo, para que un
+    corte de energía no deje el archivo final vacío o a medio escribir.
+    """
+    with open(ruta, 'r+b') as archivo:
+        os.fsync(archivo.fileno())
+
+def _lotes(items, tamano=TAMANO_LOTE):
+    """
+    Agrupa un iterable de (nombre, frecuencia) en listas de hasta 'tamano' elementos.
+    """
+    iterador = iter(items)
+    while True:
+        lote = list(islice(iterador, tamano))
+        if not lote:
+            return
+        yield lote
+
+def _exportar_texto(items, ruta, cantidad):
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        for lote in _lotes(items):
+            archivo.write("".join(f"{nombre}: {frecuencia}\n" for nombre, frecuencia in lote))
+
+def _exportar_csv(items, ruta, cantidad):
+    with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(("nombre", "frecuencia"))
+        for lote in _lotes(items):
+            escritor.writerows(lote)
+
+def _exportar_jsonl(items, ruta, cantidad):
+    # Un solo codificador reutilizado (json.dumps con opciones crea uno por llamada)
+    codificar = json.JSONEncoder(ensure_ascii=False).encode
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        for lote in _lotes(items):
+            archivo.write("".join(
+                f'{{"nombre": {codificar(nombre)}, "frecuencia": {frecuencia}}}\n'
+                for nombre, frecuencia in lote
+            ))
+
+def _exportar_sqlite(items, ruta, cantidad):
+    conexion = sqlite3.connect(ruta)
+    try:
+        # La base es un archivo temporal: no hace falta journal ni sincronización
+        conexion.execute("PRAGMA journal_mode = OFF")
+        conexion.execute("PRAGMA synchronous = OFF")
+        conexion.execute("CREATE TABLE frecuencias (nombre TEXT PRIMARY KEY, frecuencia INTEGER NOT NULL)")
+        with conexion:
+            for lote in _lotes(items):
+                conexion.executemany("INSERT INTO frecuencias (nombre, frecuencia) VALUES (?, ?)", lote)
+    finally:
+        conexion.close()
+
+def _exportar_binario(items, ruta, cantidad):
+    # Formato: FIRMA_BINARIO, uint32 cantidad y por entrada
+    # uint16 largo del nombre en UTF-8, el nombre y uint64 frecuencia (little-endian)
+    with open(ruta, 'wb') as archivo:
+        archivo.write(FIRMA_BINARIO + struct.pack("<I", cantidad))
+        for lote in _lotes(items):
+            bloque = bytearray()
+            for nombre, frecuencia in lote:
+                codificado = nombre.encode('utf-8')
+                bloque += struct.pack("<H", len(codificado))
+                bloque += codificado
+                bloque += struct.pack("<Q", frecuencia)
+            archivo.write(bloque)
+
+# Formatos de exportación disponibles
+EXPORTADORES = {
+    "texto": _exportar_texto,
+    "csv": _exportar_csv,
+    "jsonl": _exportar_jsonl,
+    "sqlite": _exportar_sqlite,
+    "binario": _exportar_binario,
+}
+
+# Formato que se usa cuando no se indica uno, según la extensión del archivo
+FORMATOS_POR_EXTENSION = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".db": "sqlite",
+    ".sqlite": "sqlite",
+    ".bin": "binario",
+}
+
+def leer_frecuencias_binario(archivo_entrada):
     """
-    Exporta el diccionario de frecuencias a un archivo de texto.
-    Cada línea contiene un nombre y su frecuencia separados por dos puntos.
-    
+    Lee un archivo generado con el formato "binario".
+
+    Returns:
+        dict: Diccionario con nombres y sus frecuencias
+    """
+    with open(archivo_entrada, 'rb') as archivo:
+        datos = archivo.read()
+    if datos[:4] != FIRMA_BINARIO:
+        raise ValueError(f"El archivo '{archivo_entrada}' no tiene el formato binario de frecuencias")
+    (cantidad,) = struct.unpack_from("<I", datos, 4)
+    frecuencias = {}
+    posicion = 8
+    for _ in range(cantidad):
+        (largo,) = struct.unpack_from("<H", datos, posicion)
+        posicion += 2
+        nombre = datos[posicion:posicion + largo].decode('utf-8')
+        posicion += largo
+        (frecuencias[nombre],) = struct.unpack_from("<Q", datos, posicion)
+        posicion += 8
+    return frecuencias
+
+def exportar_frecuencias_a_archivo(frecuencias, archivo_salida, formato=None, ordenar=False):
+    """
+    Exporta el diccionario de frecuencias a un archivo.
+    En formato "texto" cada línea contiene un nombre y su frecuencia separados por dos puntos.
+
+    La escritura es atómica: se escribe en un archivo temporal en la misma carpeta
+    y se renombra al final, así un corte nunca deja un archivo a medio escribir.
+
     Args:
         frecuencias (dict): Diccionario con nombres y sus frecuencias
         archivo_salida (str): Nombre del archivo de salida
+        formato (str): "texto", "csv", "jsonl", "sqlite" o "binario"; por defecto
+                       se deduce de la extensión (y si no, "texto")
+        ordenar (bool): Si es True, escribe de mayor a menor frecuencia
+                        (a igual frecuencia, alfabéticamente)
     """
+    ruta_temporal = None
     try:
-        with open(archivo_salida, 'w', encoding='utf-8') as archivo:
-            
-            for nombre, frecuencia in frecuencias.items():
-                archivo.write(f"{nombre}: {frecuencia}\n")
-        
+        if formato is None:
+            extension = os.path.splitext(archivo_salida)[1].lower()
+            formato = FORMATOS_POR_EXTENSION.get(extension, "texto")
+        if formato not in EXPORTADORES:
+            raise ValueError(f"formato desconocido '{formato}' (opciones: {', '.join(EXPORTADORES)})")
+
+        items = frecuencias.items()
+        if ordenar:
+            items = sorted(items, key=lambda x: (-x[1], x[0]))
+
+        carpeta = os.path.dirname(os.path.abspath(archivo_salida))
+        ruta_temporal = _crear_temporal(carpeta)
+        if formato == "sqlite":
+            # sqlite3 necesita crear el archivo desde cero (el nombre queda reservado igual)
+            os.remove(ruta_temporal)
+
+        EXPORTADORES[formato](items, ruta_temporal, len(frecuencias))
+        _sincronizar(ruta_temporal)
+        os.replace(ruta_temporal, archivo_salida)
+        ruta_temporal = None
+
         print(f"Frecuencias exportadas exitosamente a '{archivo_salida}'")
         return True
-        
+
     except Exception as e:
         print(f"Error al exportar las frecuencias: {e}")
         return False
+    finally:
+        if ruta_temporal and os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exporta las frecuencias de primer nombre a un archivo.")
+    parser.add_argument("--entrada", default="nombres.txt", help="Archivo de nombres (por defecto nombres.txt)")
+    parser.add_argument("--salida", default="frecuencia_nombres.txt", help="Archivo de salida (por defecto frecuencia_nombres.txt)")
+    parser.add_argument("--formato", choices=sorted(EXPORTADORES), default=None, help="Formato de salida")
+    parser.add_argument("--ordenar", action="store_true", help="Ordenar de mayor a menor frecuencia")
+    parser.add_argument("--incremental", metavar="DIRECTORIO", default=None,
+                        help="Procesar solo las líneas nuevas, guardando el estado en DIRECTORIO")
+    args = parser.parse_args()
+
+    if args.incremental:
+        # Snapshot + deltas: solo se leen las líneas agregadas desde la última ejecución
+        from persistencia_incremental import actualizar_frecuencias_incremental
+        contador, nuevos = actualizar_frecuencias_incremental(args.entrada, args.incremental)
+        print(f"Nombres nuevos procesados: {nuevos} (total acumulado: {contador.total})")
+        if contador.total:
+            if not exportar_frecuencias_a_archivo(contador.frecuencias, args.salida, args.formato, args.ordenar):
+                raise SystemExit(1)
+            print(f"Archivo '{args.salida}' actualizado exitosamente")
+        raise SystemExit(0)
+
     # Leer nombres del archivo nombres.txt usando la función de ordenar_nombres.py
-    archivo = "nombres.txt"
+    archivo = args.entrada
     nombres = ordenar_nombres_alfabeticamente(archivo)
-    
+
     if nombres:
         # Calcular frecuencias
         frecuencias = contar_frecuencia_nombres(nombres)
-        
+
         # Exportar a archivo
-        archivo_salida = "frecuencia_nombres.txt"
+        archivo_salida = args.salida
         print("Exportando frecuencias de nombres a archivo....")
         print("=" * 30)
-        if exportar_frecuencias_a_archivo(frecuencias, archivo_salida):
+        if exportar_frecuencias_a_archivo(frecuencias, archivo_salida, args.formato, args.ordenar):
             print(f"Archivo '{archivo_salida}' creado exitosamente")
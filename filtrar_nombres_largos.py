@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
+from bisect import bisect_right
+
 # Importar la función para leer nombres del archivo ordenar_nombres.py
-from ordenar_nombres import ordenar_nombres_alfabeticamente
+from ordenar_nombres import normalizar_para_ordenar, ordenar_nombres_alfabeticamente
+from registro_nombre import a_registro, crear_registros, longitud_primer_nombre
 
 def filtrar_nombres_largos(nombres, longitud_minima=4):
     """
@@ -9,64 +12,214 @@ def filtrar_nombres_largos(nombres, longitud_minima=4):
     primer nombre tenga más de la longitud mínima especificada.
     
     Args:
-        nombres (list): Lista de nombres completos
+        nombres (iterable): Nombres completos (str o RegistroNombre); acepta listas
+                            o iteradores como el de leer_nombres (se recorre una sola vez).
+                            Con una TablaNombres se filtra con una máscara booleana
         longitud_minima (int): Longitud mínima de caracteres del primer nombre (por defecto 4)
         
     Returns:
-        list: Lista filtrada de nombres completos que cumplen la condición
+        list: Lista filtrada con los mismos elementos recibidos que cumplen la condición
+              (una TablaNombres si se recibió una tabla)
     """
+    if hasattr(nombres, "filtrar_nombres_largos"):
+        return nombres.filtrar_nombres_largos(longitud_minima)
+    
     nombres_filtrados = []
     
     for nombre_completo in nombres:
-        primer_nombre = nombre_completo.split()[0]  # Obtener solo el primer nombre
-        if len(primer_nombre) > longitud_minima:
+        if longitud_primer_nombre(nombre_completo) > longitud_minima:
             nombres_filtrados.append(nombre_completo)
     
     return nombres_filtrados
 
-def mostrar_nombres_filtrados(nombres_originales, nombres_filtrados):
+def particionar_nombres_largos(nombres, longitud_minima=4):
+    """
+    Separa los nombres en una sola pasada: los que cumplen la condición de
+    filtrar_nombres_largos y los que no, cada grupo en el orden original.
+
+    Returns:
+        tuple: (nombres que cumplen, nombres que no cumplen), con los mismos elementos recibidos
+    """
+    cumplen = []
+    no_cumplen = []
+    for nombre_completo in nombres:
+        if longitud_primer_nombre(nombre_completo) > longitud_minima:
+            cumplen.append(nombre_completo)
+        else:
+            no_cumplen.append(nombre_completo)
+    return cumplen, no_cumplen
+
+class Criterio:
+    """
+    Condición sobre un RegistroNombre que se puede combinar con & (y), | (o)
+    y ~ (no). Usa los campos ya calculados del registro, sin volver a separar
+    el nombre. Si la condición es solo un umbral sobre la longitud del primer
+    nombre, umbral_nombre lo guarda para que IndiceLongitudes la resuelva sin evaluar la condición.
+    """
+    __slots__ = ("condicion", "umbral_nombre")
+
+    def __init__(self, condicion, umbral_nombre=None):
+        self.condicion = condicion
+        self.umbral_nombre = umbral_nombre
+
+    def __call__(self, registro):
+        return self.condicion(registro)
+
+    def __and__(self, otro):
+        primera, segunda = self.condicion, otro.condicion
+        return Criterio(lambda registro: primera(registro) and segunda(registro))
+
+    def __or__(self, otro):
+        primera, segunda = self.condicion, otro.condicion
+        return Criterio(lambda registro: primera(registro) or segunda(registro))
+
+    def __invert__(self):
+        condicion = self.condicion
+        return Criterio(lambda registro: not condicion(registro))
+
+def primer_nombre_mas_largo_que(longitud):
+    """
+    Criterio: el primer nombre tiene más de 'longitud' caracteres.
+    """
+    return Criterio(lambda registro: registro.longitud_nombre > longitud, umbral_nombre=longitud)
+
+def apellido_mas_largo_que(longitud):
+    """
+    Criterio: el apellido (todo lo que sigue al primer nombre) tiene más de 'longitud' caracteres.
+    """
+    return Criterio(lambda registro: len(registro.apellido) > longitud)
+
+def empieza_con(iniciales):
+    """
+    Criterio: el nombre completo empieza con alguna de las letras indicadas
+    (sin distinguir acentos ni mayúsculas, como la clave de ordenación).
+    """
+    claves = frozenset(normalizar_para_ordenar(letra)[:1] for letra in iniciales)
+    return Criterio(lambda registro: registro.clave[:1] in claves)
+
+class IndiceLongitudes:
+    """
+    Motor de consultas sobre un conjunto de nombres ya cargado: los registros
+    se analizan una sola vez y se cuenta cuántos hay de cada longitud del
+    primer nombre (conteos acumulados), así la cantidad para un umbral es una
+    búsqueda binaria y cada partición es una sola pasada sobre las longitudes
+    precalculadas, sin ordenar nada.
+    Los resultados conservan el orden original de los nombres.
+    """
+
+    def __init__(self, nombres=()):
+        self.registros = list(crear_registros(nombres))
+        # Longitud del primer nombre de cada registro, en el orden original
+        self._longitud_por_registro = [registro.longitud_nombre for registro in self.registros]
+        # Solo la cantidad por longitud (no hace falta guardar los registros otra vez en cubetas)
+        conteos = {}
+        for longitud in self._longitud_por_registro:
+            conteos[longitud] = conteos.get(longitud, 0) + 1
+        # Longitudes distintas de menor a mayor y cuántos registros tienen hasta cada una
+        self._longitudes = sorted(conteos)
+        self._acumulados = []
+        acumulado = 0
+        for longitud in self._longitudes:
+            acumulado += conteos[longitud]
+            self._acumulados.append(acumulado)
+
+    def __len__(self):
+        return len(self.registros)
+
+    def _hasta(self, longitud_minima):
+        # Cantidad de registros cuyo primer nombre tiene a lo sumo longitud_minima caracteres
+        corte = bisect_right(self._longitudes, longitud_minima)
+        return self._acumulados[corte - 1] if corte else 0
+
+    def cantidad_mas_largos(self, longitud_minima):
+        """
+        Cantidad de nombres cuyo primer nombre tiene más de longitud_minima caracteres.
+        """
+        return len(self.registros) - self._hasta(longitud_minima)
+
+    def particionar(self, longitud_minima=4):
+        """
+        Registros cuyo primer nombre tiene más de longitud_minima caracteres y el resto.
+
+        Returns:
+            tuple: (registros que cumplen, registros que no cumplen), en el orden original
+        """
+        hasta = self._hasta(longitud_minima)
+        if hasta == 0:
+            return self.registros[:], []
+        if hasta == len(self.registros):
+            return [], self.registros[:]
+        cumplen = []
+        no_cumplen = []
+        for registro, longitud in zip(self.registros, self._longitud_por_registro):
+            if longitud > longitud_minima:
+                cumplen.append(registro)
+            else:
+                no_cumplen.append(registro)
+        return cumplen, no_cumplen
+
+    def consultar(self, criterio):
+        """
+        Aplica un Criterio a todos los registros en una sola pasada.
+
+        Returns:
+            tuple: (registros que cumplen, registros que no cumplen), en el orden original
+        """
+        if criterio.umbral_nombre is not None:
+            return self.particionar(criterio.umbral_nombre)
+        cumplen = []
+        no_cumplen = []
+        condicion = criterio.condicion
+        for registro in self.registros:
+            if condicion(registro):
+                cumplen.append(registro)
+            else:
+                no_cumplen.append(registro)
+        return cumplen, no_cumplen
+
+def mostrar_nombres_filtrados(nombres_originales, nombres_filtrados, longitud_minima=4, nombres_no_cumplen=None):
     """
     Muestra los resultados del filtrado de manera clara.
+    Cada nombre se analiza una sola vez (RegistroNombre) para ambos listados.
+    Si no se recibe nombres_no_cumplen, se calcula con la misma longitud_minima.
     """
+    if nombres_no_cumplen is None:
+        _, nombres_no_cumplen = particionar_nombres_largos(nombres_originales, longitud_minima)
+    registros_filtrados = [a_registro(nombre) for nombre in nombres_filtrados]
     print("Filtrado de nombres por longitud del primer nombre:")
     print("=" * 50)
-    print(f"Longitud mínima del primer nombre: más de 4 caracteres")
+    print(f"Longitud mínima del primer nombre: más de {longitud_minima} caracteres")
     print(f"Total de nombres originales: {len(nombres_originales)}")
     print(f"Total de nombres filtrados: {len(nombres_filtrados)}")
     print()
     
     print("Nombres que cumplen la condición:")
     print("-" * 40)
-    for i, nombre in enumerate(nombres_filtrados, 1):
-        primer_nombre = nombre.split()[0]
-        print(f"{i:2d}. {nombre} (primer nombre: '{primer_nombre}' - {len(primer_nombre)} caracteres)")
+    for i, registro in enumerate(registros_filtrados, 1):
+        print(f"{i:2d}. {registro} (primer nombre: '{registro.nombre}' - {registro.longitud_nombre} caracteres)")
     
     print()
     print("Nombres que NO cumplen la condición:")
     print("-" * 40)
-    nombres_no_cumplen = []
-    for nombre in nombres_originales:
-        primer_nombre = nombre.split()[0]
-        if len(primer_nombre) <= 4:
-            nombres_no_cumplen.append(nombre)
-    
-    for i, nombre in enumerate(nombres_no_cumplen, 1):
-        primer_nombre = nombre.split()[0]
-        print(f"{i:2d}. {nombre} (primer nombre: '{primer_nombre}' - {len(primer_nombre)} caracteres)")
+    for i, registro in enumerate(crear_registros(nombres_no_cumplen), 1):
+        print(f"{i:2d}. {registro} (primer nombre: '{registro.nombre}' - {registro.longitud_nombre} caracteres)")
 
 if __name__ == '__main__':
     # Leer nombres del archivo nombres.txt usando la función de ordenar_nombres.py
     archivo = "nombres.txt"
-    nombres_originales = ordenar_nombres_alfabeticamente(archivo)
+    longitud_minima = 4
+    # Analizar cada nombre una sola vez y reutilizar el índice para las consultas
+    indice = IndiceLongitudes(ordenar_nombres_alfabeticamente(archivo))
+    nombres_originales = indice.registros
     
     if nombres_originales:
-        # Filtrar nombres que tengan más de 4 caracteres
-        nombres_filtrados = filtrar_nombres_largos(nombres_originales, longitud_minima=4)
+        # Filtrar nombres que tengan más de 4 caracteres (y el complemento, en la misma consulta)
+        nombres_filtrados, nombres_no_cumplen = indice.particionar(longitud_minima)
         
         # Mostrar resultados
-        mostrar_nombres_filtrados(nombres_originales, nombres_filtrados)
+        mostrar_nombres_filtrados(nombres_originales, nombres_filtrados, longitud_minima, nombres_no_cumplen)
         
         print(f"\nResumen:")
         print(f"- Nombres originales: {len(nombres_originales)}")
-        print(f"- Nombres con más de 4 caracteres: {len(nombres_filtrados)}")
-        print(f"- Nombres con 4 caracteres o menos: {len(nombres_originales) - len(nombres_filtrados)}")
+        print(f"- Nombres con más de {longitud_minima} caracteres: {len(nombres_filtrados)}")
+        print(f"- Nombres con {longitud_minima} caracteres o menos: {len(nombres_no_cumplen)}")
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Importar funciones de los archivos existentes
+from contar_frecuencia_nombres import ContadorFrecuencias
+from exportar_frecuencias import exportar_frecuencias_a_archivo
+from validacion_nombres import es_nombre_valido
+from validacion_paralela import BLOQUES_POR_PROCESO, calcular_bloques, leer_lineas_bloque
+
+def _contar_fragmento(argumentos):
+    """
+    Fase map: valida y cuenta los primeros nombres de un fragmento de archivo.
+    Devuelve el diccionario parcial de frecuencias y la cantidad de líneas inválidas.
+    """
+    archivo_entrada, inicio, fin = argumentos
+    frecuencias = {}
+    invalidos = 0
+    for linea in leer_lineas_bloque(archivo_entrada, inicio, fin):
+        nombre = linea.strip()
+        if not nombre:
+            continue
+        if es_nombre_valido(nombre):
+            primer_nombre = nombre.split(None, 1)[0]
+            frecuencias[primer_nombre] = frecuencias.get(primer_nombre, 0) + 1
+        else:
+            invalidos += 1
+    return frecuencias, invalidos
+
+def dividir_en_fragmentos(archivos, procesos):
+    """
+    Divide todos los archivos en fragmentos alineados a saltos de línea, de modo
+    que un archivo grande también se reparta entre varios procesos.
+    """
+    tamano_total = sum(os.path.getsize(archivo) for archivo in archivos)
+    fragmentos = []
+    for archivo in archivos:
+        tamano = os.path.getsize(archivo)
+        # Cada archivo recibe bloques en proporción a su tamaño
+        cantidad = max(1, round(procesos * BLOQUES_POR_PROCESO * tamano / tamano_total)) if tamano_total else 1
+        fragmentos.extend((archivo, inicio, fin) for inicio, fin in calcular_bloques(archivo, cantidad))
+    return fragmentos
+
+def _reducir(parciales):
+    """
+    Fase reduce: fusiona los contadores parciales en uno solo.
+    """
+    contador = ContadorFrecuencias()
+    invalidos = 0
+    for frecuencias, cantidad_invalidos in parciales:
+        contador.fusionar(frecuencias)
+        invalidos += cantidad_invalidos
+    return contador, invalidos
+
+def contar_frecuencia_paralelo(archivos, procesos=None):
+    """
+    Cuenta frecuencias de primer nombre de muchos archivos en paralelo (map-reduce).
+
+    Cada archivo se divide en fragmentos que se validan y cuentan en un pool
+    de procesos (map); los contadores parciales se fusionan en uno solo (reduce).
+    No ordena los nombres: solo se calculan las frecuencias.
+
+    Args:
+        archivos (list): Rutas de los archivos de nombres (UTF-8)
+        procesos (int): Cantidad de procesos (por defecto, uno por núcleo)
+
+    Returns:
+        tuple: (ContadorFrecuencias con el total, cantidad de líneas inválidas)
+    """
+    procesos = procesos or os.cpu_count() or 1
+    fragmentos = dividir_en_fragmentos(archivos, procesos)
+
+    if procesos == 1 or len(fragmentos) <= 1:
+        return _reducir(map(_contar_fragmento, fragmentos))
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        return _reducir(ejecutor.map(_contar_fragmento, fragmentos))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Cuenta frecuencias de primer nombre de varios archivos en paralelo.")
+    parser.add_argument("archivos", nargs="*", default=["nombres.txt"], help="Archivos de nombres a procesar")
+    parser.add_argument("--procesos", type=int, default=None, help="Cantidad de procesos (por defecto, uno por núcleo)")
+    parser.add_argument("--salida", default="frecuencia_nombres.txt", help="Archivo de salida (por defecto frecuencia_nombres.txt)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    try:
+        contador, invalidos = contar_frecuencia_paralelo(args.archivos, args.procesos)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[ERROR] No se pudieron procesar los archivos: {e}")
+        raise SystemExit(1)
+    duracion = time.perf_counter() - inicio
+
+    print(f"Archivos procesados: {len(args.archivos)}")
+    print(f"Nombres contados: {contador.total} ({invalidos} líneas inválidas)")
+    print(f"Primeros nombres distintos: {len(contador)}")
+    print(f"Tiempo: {duracion:.2f} s")
+    exportar_frecuencias_a_archivo(contador.frecuencias, args.salida)
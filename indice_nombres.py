@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Importar funciones de los archivos existentes
+from ordenamiento_externo import ordenar_nombres_externo
+from ordenar_nombres import leer_nombres, normalizar_para_ordenar
+
+# Cabecera: firma, cantidad de nombres, tamaño y mtime (ns) del archivo de origen,
+# posición de la tabla de offsets
+FIRMA_INDICE = b"IDXNOM01"
+FORMATO_CABECERA = "<8sQQqQ"
+TAMANO_CABECERA = struct.calcsize(FORMATO_CABECERA)
+SEPARADOR = b"\x00"
+
+def construir_indice(archivo_fuente, ruta_indice, memoria_maxima_mb=64):
+    """
+    Construye el índice ordenado de un archivo de nombres.
+
+    Formato: cabecera, luego cada entrada como "clave\\0nombre" en UTF-8
+    ordenada por normalizar_para_ordenar, y al final una tabla de offsets de
+    ancho fijo (uint64 en el orden de bytes de la máquina, cantidad + 1 valores).
+    Se ordena con ordenamiento externo, así que sirve para archivos más
+    grandes que la memoria. La escritura es atómica (archivo temporal + rename).
+    """
+    estado = os.stat(archivo_fuente)
+    carpeta = os.path.dirname(os.path.abspath(ruta_indice))
+    descriptor, ruta_temporal = tempfile.mkstemp(prefix=".indice_", dir=carpeta)
+    try:
+        offsets = array('Q', [TAMANO_CABECERA])
+        with open(descriptor, 'wb') as archivo:
+            archivo.write(bytes(TAMANO_CABECERA))
+            posicion = TAMANO_CABECERA
+            for nombre in ordenar_nombres_externo(leer_nombres(archivo_fuente), memoria_maxima_mb):
+                entrada = normalizar_para_ordenar(nombre).encode('utf-8') + SEPARADOR + nombre.encode('utf-8')
+                archivo.write(entrada)
+                posicion += len(entrada)
+                offsets.append(posicion)
+
+            # Alinear la tabla a 8 bytes para poder verla como uint64 sin copiar
+            relleno = -posicion % 8
+            archivo.write(bytes(relleno))
+            posicion_tabla = posicion + relleno
+            offsets.tofile(archivo)
+
+            archivo.seek(0)
+            archivo.write(struct.pack(FORMATO_CABECERA, FIRMA_INDICE, len(offsets) - 1,
+                                      estado.st_size, estado.st_mtime_ns, posicion_tabla))
+        os.replace(ruta_temporal, ruta_indice)
+    except BaseException:
+        os.remove(ruta_temporal)
+        raise
+
+class _ClavesIndice:
+    """
+    Vista de solo lectura de las claves del índice, para usar con bisect.
+    """
+
+    def __init__(self, indice):
+        self.indice = indice
+
+    def __len__(self):
+        return len(self.indice)
+
+    def __getitem__(self, posicion):
+        return self.indice.clave(posicion)
+
+class IndiceNombres:
+    """
+    Índice de nombres ordenado, abierto con mmap: no se parsea nada al abrirlo
+    y cada búsqueda es una búsqueda binaria sobre la tabla de offsets.
+    Las consultas no distinguen acentos ni mayúsculas (usan normalizar_para_ordenar).
+    """
+
+    def __init__(self, ruta_indice):
+        self.ruta = ruta_indice
+        with open(ruta_indice, 'rb') as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            firma, self.cantidad, self.tamano_origen, self.mtime_origen, posicion_tabla = \
+                struct.unpack_from(FORMATO_CABECERA, self._mapa, 0)
+            if firma != FIRMA_INDICE:
+                raise ValueError(f"El archivo '{ruta_indice}' no es un índice de nombres")
+            fin_tabla = posicion_tabla + 8 * (self.cantidad + 1)
+            if fin_tabla > len(self._mapa):
+                raise ValueError(f"El índice '{ruta_indice}' está incompleto")
+            self._offsets = memoryview(self._mapa)[posicion_tabla:fin_tabla].cast('Q')
+        except BaseException:
+            # Sin cerrar el mapa, en Windows no se podría reemplazar el archivo al reconstruirlo
+            self._mapa.close()
+            raise
+        self._claves = _ClavesIndice(self)
+
+    def __len__(self):
+        return self.cantidad
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        self._offsets.release()
+        self._mapa.close()
+
+    def clave(self, posicion):
+        """
+        Clave normalizada (bytes UTF-8) de la entrada en la posición indicada.
+        """
+        inicio = self._offsets[posicion]
+        return self._mapa[inicio:self._mapa.find(SEPARADOR, inicio, self._offsets[posicion + 1])]
+
+    def nombre(self, posicion):
+        """
+        Nombre completo de la entrada en la posición indicada.
+        """
+        inicio = self._offsets[posicion]
+        fin = self._offsets[posicion + 1]
+        return self._mapa[self._mapa.find(SEPARADOR, inicio, fin) + 1:fin].decode('utf-8')
+
+    def _nombres(self, desde, hasta):
+        for posicion in range(desde, hasta):
+            yield self.nombre(posicion)
+
+    def buscar(self, nombre):
+        """
+        Todos los nombres cuya clave coincide con la de nombre (ignorando acentos y mayúsculas).
+        """
+        clave = normalizar_para_ordenar(nombre.strip()).encode('utf-8')
+        return list(self._nombres(bisect_left(self._claves, clave), bisect_right(self._claves, clave)))
+
+    def contiene(self, nombre):
+        """
+        Indica si el nombre exacto está en el índice.
+        """
+        return nombre.strip() in self.buscar(nombre)
+
+    def rango(self, desde, hasta):
+        """
+        Nombres entre desde y hasta (ambos incluidos), en orden alfabético.
+        """
+        clave_desde = normalizar_para_ordenar(desde).encode('utf-8')
+        clave_hasta = normalizar_para_ordenar(hasta).encode('utf-8')
+        return self._nombres(bisect_left(self._claves, clave_desde), bisect_right(self._claves, clave_hasta))
+
+    def prefijo(self, prefijo):
+        """
+        Nombres que empiezan con prefijo, en orden alfabético.
+        """
+        clave = normalizar_para_ordenar(prefijo).encode('utf-8')
+        posicion = bisect_left(self._claves, clave)
+        while posicion < self.cantidad and self.clave(posicion).startswith(clave):
+            yield self.nombre(posicion)
+            posicion += 1
+
+def abrir_indice(archivo_fuente, ruta_indice=None, memoria_maxima_mb=64):
+    """
+    Abre el índice de archivo_fuente, reconstruyéndolo si no existe o si el
+    tamaño o la fecha de modificación del archivo de origen cambiaron.
+
+    Args:
+        archivo_fuente (str): Archivo de nombres
+        ruta_indice (str): Ruta del índice (por defecto archivo_fuente + ".idx")
+
+    Returns:
+        IndiceNombres: Índice abierto (cerrarlo con cerrar() o usarlo con 'with')
+    """
+    ruta_indice = ruta_indice or archivo_fuente + ".idx"
+    estado = os.stat(archivo_fuente)
+    if os.path.exists(ruta_indice):
+        try:
+            indice = IndiceNombres(ruta_indice)
+        except (ValueError, struct.error):
+            indice = None
+        if indice is not None:
+            if (indice.tamano_origen, indice.mtime_origen) == (estado.st_size, estado.st_mtime_ns):
+                return indice
+            indice.cerrar()
+    construir_indice(archivo_fuente, ruta_indice, memoria_maxima_mb)
+    return IndiceNombres(ruta_indice)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Búsquedas en un índice ordenado de nombres (mmap).")
+    parser.add_argument("archivo", nargs="?", default="nombres.txt", help="Archivo de nombres")
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument("--buscar", metavar="NOMBRE", help="Búsqueda exacta (sin distinguir acentos)")
+    grupo.add_argument("--prefijo", metavar="TEXTO", help="Nombres que empiezan con TEXTO")
+    grupo.add_argument("--rango", nargs=2, metavar=("DESDE", "HASTA"), help="Nombres entre DESDE y HASTA")
+    args = parser.parse_args()
+
+    with abrir_indice(args.archivo) as indice:
+        if args.buscar:
+            resultados = indice.buscar(args.buscar)
+        elif args.prefijo:
+            resultados = list(indice.prefijo(args.prefijo))
+        else:
+            resultados = list(indice.rango(*args.rango))
+        for i, nombre in enumerate(resultados, 1):
+            print(f"{i:2d}. {nombre}")
+        print(f"\nResultados: {len(resultados)} de {len(indice)} nombres indexados")
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left, bisect_right
+
+# Importar la clave de ordenación de ordenar_nombres.py y los registros ya analizados
+from ordenar_nombres import normalizar_para_ordenar
+from registro_nombre import RegistroNombre
+
+# Carácter mayor que cualquier otro: cota superior de todas las claves con un prefijo
+_MAXIMO_CARACTER = "\U0010ffff"
+
+def _clave_y_nombre(valor):
+    """
+    Clave de ordenación y nombre completo de un str o de un RegistroNombre
+    (que ya trae su clave calculada).
+    """
+    if isinstance(valor, RegistroNombre):
+        return valor.clave, valor.completo
+    nombre = str(valor)
+    return normalizar_para_ordenar(nombre), nombre
+
+class IndicePrefijos:
+    """
+    Índice de prefijos en memoria sobre arreglos ordenados (sin árbol): cada
+    nombre completo distinto aparece una vez, con su clave normalizada y la
+    cantidad de veces que aparece. Una búsqueda por prefijo son dos bisect
+    más la lectura de los resultados pedidos. No distingue acentos ni mayúsculas.
+
+    Con registros (RegistroNombre) se usa la clave que ya traen. Si los
+    nombres ya vienen ordenados por clave (ordenados=True, como los de
+    FileAnalysis), el índice se arma en una sola pasada, sin volver a ordenar.
+    """
+
+    def __init__(self, nombres=(), ordenados=False):
+        self.claves = []
+        self.nombres = []
+        self.conteos = []
+        if ordenados:
+            self._construir_ordenado(nombres)
+            return
+        entradas = {}
+        for valor in nombres:
+            clave, nombre = _clave_y_nombre(valor)
+            entrada = entradas.get(nombre)
+            if entrada is None:
+                entradas[nombre] = [clave, 1]
+            else:
+                entrada[1] += 1
+        for nombre, (clave, cantidad) in sorted(entradas.items(), key=lambda item: (item[1][0], item[0])):
+            self.claves.append(clave)
+            self.nombres.append(nombre)
+            self.conteos.append(cantidad)
+
+    def _construir_ordenado(self, nombres):
+        # Los nombres con la misma clave llegan juntos: se cuentan por grupo y
+        # solo cada grupo (pocos nombres) se ordena por nombre
+        claves, lista_nombres, conteos = self.claves, self.nombres, self.conteos
+        clave_grupo = None
+        grupo = {}
+        for valor in nombres:
+            clave, nombre = _clave_y_nombre(valor)
+            if clave != clave_grupo:
+                for nombre_grupo in sorted(grupo):
+                    claves.append(clave_grupo)
+                    lista_nombres.append(nombre_grupo)
+                    conteos.append(grupo[nombre_grupo])
+                clave_grupo = clave
+                grupo = {}
+            grupo[nombre] = grupo.get(nombre, 0) + 1
+        for nombre_grupo in sorted(grupo):
+            claves.append(clave_grupo)
+            lista_nombres.append(nombre_grupo)
+            conteos.append(grupo[nombre_grupo])
+
+    def __len__(self):
+        return len(self.claves)
+
+    def fusionar_ordenados(self, nombres):
+        """
+        Devuelve un índice nuevo con nombres agregados, sin modificar este.
+
+        nombres debe venir ordenado por clave (como los de FileAnalysis). Se
+        agrupan en entradas (clave, nombre, cantidad) y se mezclan con los
+        arreglos en una sola pasada: cada entrada nueva se ubica con bisect
+        y los tramos sin cambios se copian enteros.
+        """
+        nuevas = IndicePrefijos(nombres, ordenados=True)
+        claves, lista_nombres, conteos = [], [], []
+        desde = 0
+        for clave, nombre, cantidad in zip(nuevas.claves, nuevas.nombres, nuevas.conteos):
+            inicio = bisect_left(self.claves, clave, desde)
+            fin = bisect_right(self.claves, clave, inicio)
+            # Dentro de una misma clave, las entradas están ordenadas por nombre
+            posicion = bisect_left(self.nombres, nombre, inicio, fin)
+            claves += self.claves[desde:posicion]
+            lista_nombres += self.nombres[desde:posicion]
+            conteos += self.conteos[desde:posicion]
+            desde = posicion
+            if posicion < fin and self.nombres[posicion] == nombre:
+                cantidad += self.conteos[posicion]
+                desde += 1
+            claves.append(clave)
+            lista_nombres.append(nombre)
+            conteos.append(cantidad)
+        claves += self.claves[desde:]
+        lista_nombres += self.nombres[desde:]
+        conteos += self.conteos[desde:]
+        nuevas.claves, nuevas.nombres, nuevas.conteos = claves, lista_nombres, conteos
+        return nuevas
+
+    def rango_prefijo(self, prefijo):
+        """
+        Posiciones (inicio, fin) de las entradas cuya clave empieza con prefijo.
+        """
+        clave = normalizar_para_ordenar(prefijo.lstrip())
+        inicio = bisect_left(self.claves, clave)
+        fin = bisect_left(self.claves, clave + _MAXIMO_CARACTER, inicio)
+        return inicio, fin
+
+    def buscar(self, prefijo, limite=100):
+        """
+        Busca los nombres que empiezan con prefijo.
+
+        Args:
+            prefijo (str): Texto escrito por el usuario
+            limite (int): Cantidad máxima de resultados a devolver
+
+        Returns:
+            tuple: (lista de (nombre, cantidad) en orden alfabético, total de coincidencias)
+        """
+        inicio, fin = self.rango_prefijo(prefijo)
+        hasta = min(fin, inicio + limite)
+        return list(zip(self.nombres[inicio:hasta], self.conteos[inicio:hasta])), fin - inicio
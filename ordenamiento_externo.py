@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+
+# Importar el lector en streaming y la clave de ordenación de ordenar_nombres.py
+from ordenar_nombres import leer_nombres, normalizar_para_ordenar
+
+# Costo aproximado en memoria de cada nombre dentro de un tramo:
+# el objeto str, su clave normalizada y la entrada en la lista
+BYTES_EXTRA_POR_NOMBRE = 120
+# Cantidad máxima de tramos que se mezclan a la vez (limita archivos abiertos)
+MAX_TRAMOS_POR_MEZCLA = 64
+
+def _escribir_tramo(nombres, directorio_temporal):
+    """
+    Ordena un tramo en memoria y lo vuelca a un archivo temporal (un nombre por línea).
+    Devuelve la ruta del archivo creado.
+    """
+    nombres.sort(key=normalizar_para_ordenar)
+    descriptor, ruta = tempfile.mkstemp(prefix="tramo_", suffix=".txt", dir=directorio_temporal)
+    with open(descriptor, 'w', encoding='utf-8') as archivo:
+        # Línea por línea (el archivo ya usa un búfer): un join crearía una segunda copia del tramo
+        archivo.writelines(nombre + "\n" for nombre in nombres)
+    return ruta
+
+def _leer_tramo(ruta):
+    """
+    Recorre un tramo ya ordenado, nombre por nombre.
+    """
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        for linea in archivo:
+            yield linea.rstrip("\n")
+
+def _mezclar_tramos(rutas, directorio_temporal):
+    """
+    Mezcla un grupo de tramos en uno nuevo y borra los originales.
+    """
+    descriptor, ruta_salida = tempfile.mkstemp(prefix="tramo_", suffix=".txt", dir=directorio_temporal)
+    with open(descriptor, 'w', encoding='utf-8') as archivo:
+        for nombre in heapq.merge(*(_leer_tramo(ruta) for ruta in rutas), key=normalizar_para_ordenar):
+            archivo.write(nombre + "\n")
+    for ruta in rutas:
+        os.remove(ruta)
+    return ruta_salida
+
+def ordenar_nombres_externo(nombres, memoria_maxima_mb=64, directorio_temporal=None):
+    """
+    Ordena alfabéticamente un flujo de nombres que puede no caber en memoria
+    (ordenamiento externo por mezcla).
+
+    Los nombres se acumulan en tramos de tamaño acotado por memoria_maxima_mb,
+    cada tramo se ordena y se vuelca a un archivo temporal, y al final los
+    tramos se mezclan con una mezcla de k vías. Usa la misma clave que
+    normalizar_para_ordenar y es estable, por lo que el resultado coincide
+    con sorted(nombres, key=normalizar_para_ordenar).
+
+    Args:
+        nombres (iterable): Nombres válidos (por ejemplo, el generador leer_nombres)
+        memoria_maxima_mb (float): Presupuesto aproximado de memoria para cada tramo
+        directorio_temporal (str): Carpeta para los tramos (por defecto la del sistema)
+
+    Yields:
+        str: Los nombres en orden alfabético
+    """
+    presupuesto = max(1, int(memoria_maxima_mb * 1024 * 1024))
+    with tempfile.TemporaryDirectory(prefix="orden_externo_", dir=directorio_temporal) as carpeta:
+        rutas = []
+        tramo = []
+        ocupado = 0
+
+        for nombre in nombres:
+            tramo.append(nombre)
+            ocupado += sys.getsizeof(nombre) * 2 + BYTES_EXTRA_POR_NOMBRE
+            if ocupado >= presupuesto:
+                rutas.append(_escribir_tramo(tramo, carpeta))
+                tramo = []
+                ocupado = 0
+
+        # Todo entró en un solo tramo: no hace falta tocar el disco
+        if not rutas:
+            tramo.sort(key=normalizar_para_ordenar)
+            yield from tramo
+            return
+
+        if tramo:
+            rutas.append(_escribir_tramo(tramo, carpeta))
+        del tramo
+
+        # Mezclas intermedias si hay demasiados tramos para abrirlos juntos
+        # (se mezclan grupos consecutivos para conservar la estabilidad)
+        while len(rutas) > MAX_TRAMOS_POR_MEZCLA:
+            rutas = [
+                _mezclar_tramos(rutas[i:i + MAX_TRAMOS_POR_MEZCLA], carpeta)
+                for i in range(0, len(rutas), MAX_TRAMOS_POR_MEZCLA)
+            ]
+
+        yield from heapq.merge(*(_leer_tramo(ruta) for ruta in rutas), key=normalizar_para_ordenar)
+
+def ordenar_archivo_externo(archivo_entrada, archivo_salida, memoria_maxima_mb=64, directorio_temporal=None):
+    """
+    Lee, valida y ordena un archivo de nombres de cualquier tamaño y escribe
+    el resultado en archivo_salida, un nombre por línea.
+
+    Returns:
+        int: Cantidad de nombres escritos
+    """
+    total = 0
+    nombres = leer_nombres(archivo_entrada)
+    with open(archivo_salida, 'w', encoding='utf-8') as salida:
+        for nombre in ordenar_nombres_externo(nombres, memoria_maxima_mb, directorio_temporal):
+            salida.write(nombre + "\n")
+            total += 1
+    return total
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Ordena archivos de nombres más grandes que la memoria disponible.")
+    parser.add_argument("entrada", nargs="?", default="nombres.txt", help="Archivo de nombres de entrada")
+    parser.add_argument("salida", nargs="?", default="nombres_ordenados.txt", help="Archivo de salida ordenado")
+    parser.add_argument("--memoria-mb", type=float, default=64, help="Memoria máxima por tramo en MB (por defecto 64)")
+    parser.add_argument("--temporal", default=None, help="Carpeta para los archivos temporales")
+    args = parser.parse_args()
+
+    try:
+        total = ordenar_archivo_externo(args.entrada, args.salida, args.memoria_mb, args.temporal)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[ERROR] No se pudo ordenar el archivo '{args.entrada}': {e}")
+        sys.exit(1)
+    print(f"[EXITO] {total} nombres ordenados escritos en '{args.salida}'")
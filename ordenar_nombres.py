@@ -1,153 +1,379 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
+import sys
+import time
 import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-def normalizar_para_ordenar(texto):
+# Importar la validación compilada de validacion_nombres.py
+from validacion_nombres import es_nombre_valido, lineas_advertencia
+
+# Tamaño máximo de la caché de claves con acentos (solo esas pasan por la caché)
+TAMANO_CACHE_CLAVES = 1 << 16
+# Cada cuántas claves con acentos se revisa si la caché está acertando
+INTERVALO_REVISION_CACHE = 1 << 14
+# Proporción mínima de aciertos para que la caché convenga (un fallo cuesta
+# alrededor de un cuarto de lo que ahorra un acierto)
+MINIMO_ACIERTOS_CACHE = 0.25
+# Con pocos aciertos, cantidad de intervalos sin caché antes de volver a probarla
+INTERVALOS_SIN_CACHE = 8
+
+def _normalizar_unicode(texto):
     """
-    Normaliza un texto para ordenación alfabética correcta,
-    manejando acentos y tildes apropiadamente.
+    Camino general: descomposición NFD y eliminación de marcas diacríticas.
     """
     # Remover acentos pero mantener la letra base
     texto_normalizado = unicodedata.normalize('NFD', texto)
     # Filtrar solo caracteres que no sean marcas diacríticas
-    texto_sin_acentos = ''.join(c for c in texto_normalizado 
-                               if unicodedata.category(c) != 'Mn')
-    return texto_sin_acentos.lower()
+    return ''.join(c for c in texto_normalizado 
+                   if unicodedata.category(c) != 'Mn')
 
-def ordenar_nombres_alfabeticamente(archivo_entrada):
+def _construir_tabla_sin_acentos():
     """
-    Lee nombres de un archivo y los ordena alfabéticamente.
-    Incluye manejo robusto de errores para diferentes escenarios.
+    Precalcula una tabla para str.translate que quita los acentos de los
+    caracteres latinos más comunes (Latin-1 y Latin Extended-A/B) y elimina
+    las marcas diacríticas combinables sueltas.
     """
-    try:
-        # Verificar si el archivo existe
-        import os
-        import sys
-        import string
-
-        # Impresión segura (evita UnicodeEncodeError en consolas Windows)
-        def safe_print(text: str) -> None:
-            encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
-            try:
-                print(text)
-            except UnicodeEncodeError:
-                print(text.encode(encoding, errors="replace").decode(encoding, errors="replace"))
-        if not os.path.exists(archivo_entrada):
-            print(f"[ERROR] El archivo '{archivo_entrada}' no existe.")
-            return []
-        
-        # Verificar si el archivo está vacío
-        if os.path.getsize(archivo_entrada) == 0:
-            print(f"[ERROR] El archivo '{archivo_entrada}' está vacío.")
-            return []
-        
-        # Leer el archivo con codificación UTF-8 para manejar acentos
-        with open(archivo_entrada, 'r', encoding='utf-8') as archivo:
-            lineas = archivo.readlines()
-        
-        # Verificar si se pudieron leer líneas
-        if not lineas:
-            safe_print(f"[ERROR] No se pudieron leer líneas del archivo '{archivo_entrada}'.")
-            return []
-        
-        # Limpiar líneas vacías y espacios en blanco
-        nombres = [linea.strip() for linea in lineas if linea.strip()]
-        
-        # Verificar si hay nombres válidos después de la limpieza
-        if not nombres:
-            safe_print(f"[ERROR] El archivo '{archivo_entrada}' no contiene datos válidos.")
-            safe_print("   El archivo puede contener solo líneas vacías o espacios en blanco.")
-            return []
-        
-        # Validar que los nombres tengan formato válido (al menos un carácter alfanumérico)
-        nombres_validos = []
-        nombres_invalidos = []
-        
-        for nombre in nombres:
-            nombre_limpio = nombre.strip()
-            
-            # Reglas estrictas para formato "Nombre Apellido":
-            # - Solo letras, espacios y acentos (sin números, símbolos, barras invertidas)
-            # - Al menos 2 palabras separadas por espacios
-            # - Cada palabra debe tener al menos 2 letras
-            tiene_barras = "\\" in nombre_limpio
-            solo_letras_espacios = all(c.isalpha() or c.isspace() or c in "áéíóúüñÁÉÍÓÚÜÑ" for c in nombre_limpio)
-            palabras = [palabra.strip() for palabra in nombre_limpio.split() if palabra.strip()]
-            palabras_validas = all(len(palabra) >= 2 and palabra.isalpha() for palabra in palabras)
+    tabla = {}
+    for codigo in range(0x80, 0x250):
+        caracter = chr(codigo)
+        sin_acento = _normalizar_unicode(caracter)
+        if sin_acento != caracter:
+            tabla[codigo] = sin_acento
+    for codigo in range(0x300, 0x370):
+        if unicodedata.category(chr(codigo)) == 'Mn':
+            tabla[codigo] = None
+    return tabla
+
+_TABLA_SIN_ACENTOS = _construir_tabla_sin_acentos()
+
+@lru_cache(maxsize=TAMANO_CACHE_CLAVES)
+def _normalizar_no_ascii(texto):
+    """
+    Clave de un texto con caracteres no ASCII: tabla precalculada para los
+    acentos latinos habituales y unicodedata para el resto.
+    """
+    texto_sin_acentos = texto.translate(_TABLA_SIN_ACENTOS)
+    if texto_sin_acentos.isascii():
+        return texto_sin_acentos.lower()
+    return _normalizar_unicode(texto).lower()
+
+_calcular_sin_cache = _normalizar_no_ascii.__wrapped__
+# Estado de la caché adaptativa: función que calcula las claves con acentos
+# (con o sin caché), claves que faltan para la próxima revisión, aciertos
+# al empezar el intervalo e intervalos que faltan para volver a probar la caché
+_clave_con_acentos = _normalizar_no_ascii
+_faltan_para_revisar = INTERVALO_REVISION_CACHE
+_aciertos_al_revisar = 0
+_intervalos_sin_cache = 0
+
+def _revisar_cache():
+    """
+    Decide si las próximas claves con acentos pasan por la caché: con muchos
+    nombres distintos casi nunca acierta y cada fallo solo suma costo, así
+    que se deja de usar por unos intervalos y después se vuelve a probar.
+    """
+    global _clave_con_acentos, _faltan_para_revisar, _aciertos_al_revisar, _intervalos_sin_cache
+    _faltan_para_revisar = INTERVALO_REVISION_CACHE
+    aciertos = _normalizar_no_ascii.cache_info().hits
+    if _intervalos_sin_cache:
+        _intervalos_sin_cache -= 1
+    elif aciertos - _aciertos_al_revisar < MINIMO_ACIERTOS_CACHE * INTERVALO_REVISION_CACHE:
+        _intervalos_sin_cache = INTERVALOS_SIN_CACHE
+    _aciertos_al_revisar = aciertos
+    _clave_con_acentos = _calcular_sin_cache if _intervalos_sin_cache else _normalizar_no_ascii
+
+def limpiar_cache_claves():
+    """
+    Vacía la caché de claves y vuelve a empezar la medición de aciertos.
+    """
+    global _clave_con_acentos, _faltan_para_revisar, _aciertos_al_revisar, _intervalos_sin_cache
+    _normalizar_no_ascii.cache_clear()
+    _clave_con_acentos = _normalizar_no_ascii
+    _faltan_para_revisar = INTERVALO_REVISION_CACHE
+    _aciertos_al_revisar = 0
+    _intervalos_sin_cache = 0
+
+def normalizar_para_ordenar(texto):
+    """
+    Normaliza un texto para ordenación alfabética correcta,
+    manejando acentos y tildes apropiadamente.
+    
+    Usa un atajo para texto ASCII, una tabla precalculada para los acentos
+    latinos habituales y solo recurre a unicodedata para el resto. Solo las
+    claves con acentos se memorizan en una caché LRU acotada
+    (TAMANO_CACHE_CLAVES), y solo mientras acierte lo suficiente: con muchos
+    nombres distintos se calculan directamente (ver _revisar_cache).
+    """
+    if texto.isascii():
+        return texto.lower()
+    global _faltan_para_revisar
+    _faltan_para_revisar -= 1
+    if not _faltan_para_revisar:
+        _revisar_cache()
+    return _clave_con_acentos(texto)
+
+def leer_nombres(archivo_entrada, estadisticas=None, max_ejemplos=5, rechazos=None):
+    """
+    Generador que lee un archivo línea a línea y produce, uno por uno,
+    los nombres válidos ya limpios. Nunca mantiene el archivo completo en memoria.
+    
+    Args:
+        archivo_entrada (str): Ruta del archivo de nombres (UTF-8)
+        estadisticas (dict): Diccionario opcional que se completa durante la lectura
+                             con las claves 'lineas', 'no_vacias', 'validos',
+                             'invalidos' y 'ejemplos_invalidos'
+        max_ejemplos (int): Cantidad máxima de líneas inválidas guardadas como ejemplo
+        rechazos (file): Archivo abierto opcional donde se escribe cada línea
+                         inválida como "numero_linea<TAB>linea"
+    
+    Yields:
+        str: Cada nombre válido, en el orden del archivo
+    """
+    if estadisticas is None:
+        estadisticas = {}
+    estadisticas.update(lineas=0, no_vacias=0, validos=0, invalidos=0, ejemplos_invalidos=[])
+    
+    with open(archivo_entrada, 'r', encoding='utf-8') as archivo:
+        for linea in archivo:
+            estadisticas["lineas"] += 1
+            nombre = linea.strip()
+            if not nombre:
+                continue
+            estadisticas["no_vacias"] += 1
             
-            es_valido = (
-                bool(nombre_limpio)
-                and not tiene_barras
-                and solo_letras_espacios
-                and len(palabras) >= 2
-                and palabras_validas
-            )
-
-            if es_valido:
-                nombres_validos.append(nombre_limpio)
+            if es_nombre_valido(nombre):
+                estadisticas["validos"] += 1
+                yield nombre
             else:
-                nombres_invalidos.append(nombre)
-        
-        # Mostrar advertencias sobre nombres inválidos si los hay
-        if nombres_invalidos:
-            safe_print(f"[ADVERTENCIA] Se encontraron {len(nombres_invalidos)} líneas con datos inválidos:")
-            safe_print("   (Strings extraños, formato incorrecto, o solo espacios/saltos de línea)")
-            for nombre_invalido in nombres_invalidos[:5]:  # Mostrar máximo 5 ejemplos
-                safe_print(f"   - '{str(nombre_invalido)}'")
-            if len(nombres_invalidos) > 5:
-                safe_print(f"   ... y {len(nombres_invalidos) - 5} más.")
-            safe_print("")
-            
-            # Si hay nombres válidos, mostrar mensaje de éxito parcial
-            if nombres_validos:
-                safe_print(f"[INFO] Sin embargo, se encontraron {len(nombres_validos)} nombres válidos que serán procesados.")
-                safe_print("")
-        
-        # Verificar si quedan nombres válidos después del filtrado
-        if not nombres_validos:
-            print(f"[ERROR] No se encontraron nombres válidos en el archivo '{archivo_entrada}'.")
-            return []
-        
-        # Ordenar usando la función de normalización personalizada
-        nombres_ordenados = sorted(nombres_validos, key=normalizar_para_ordenar)
-        
-        safe_print("[EXITO] Nombres ordenados alfabéticamente:")
-        safe_print("=" * 40)
-        for i, nombre in enumerate(nombres_ordenados, 1):
-            safe_print(f"{i:2d}. {nombre}")
-        
-        return nombres_ordenados
-        
+                estadisticas["invalidos"] += 1
+                if len(estadisticas["ejemplos_invalidos"]) < max_ejemplos:
+                    estadisticas["ejemplos_invalidos"].append(nombre)
+                if rechazos is not None:
+                    rechazos.write(f"{estadisticas['lineas']}\t{nombre}\n")
+
+@dataclass
+class ResultadoOrdenamiento:
+    """
+    Resultado de procesar_nombres: nombres ordenados, diagnósticos y tiempos.
+    
+    Attributes:
+        archivo (str): Archivo procesado
+        nombres (list): Nombres válidos ordenados alfabéticamente
+        total_lineas (int): Líneas leídas, incluidas las vacías
+        lineas_no_vacias (int): Líneas con contenido
+        cantidad_invalidos (int): Líneas rechazadas por formato
+        ejemplos_invalidos (list): Primeras líneas rechazadas (máximo 5)
+        mensajes (list): Diagnósticos con el mismo texto que se muestra en consola
+        tiempos (dict): Segundos de 'lectura', 'ordenamiento', 'salida' y 'total'
+    """
+    archivo: str
+    nombres: list = field(default_factory=list)
+    total_lineas: int = 0
+    lineas_no_vacias: int = 0
+    cantidad_invalidos: int = 0
+    ejemplos_invalidos: list = field(default_factory=list)
+    mensajes: list = field(default_factory=list)
+    tiempos: dict = field(default_factory=dict)
+    
+    @property
+    def exito(self):
+        return bool(self.nombres)
+
+def _escribir_consola(lineas, salida=None):
+    """
+    Escribe varias líneas en la consola con una sola escritura.
+    Evita UnicodeEncodeError en consolas Windows reemplazando lo que no se pueda codificar.
+    """
+    salida = salida or sys.stdout
+    if not lineas:
+        return
+    texto = "\n".join(lineas) + "\n"
+    try:
+        salida.write(texto)
+    except UnicodeEncodeError:
+        encoding = getattr(salida, "encoding", None) or "utf-8"
+        salida.write(texto.encode(encoding, errors="replace").decode(encoding, errors="replace"))
+    salida.flush()
+
+def _escribir_listado(nombres, salida=None, tamano_lote=10000):
+    """
+    Escribe el listado numerado de nombres en lotes grandes en lugar de un print por nombre.
+    """
+    _escribir_consola(["[EXITO] Nombres ordenados alfabéticamente:", "=" * 40], salida)
+    for inicio in range(0, len(nombres), tamano_lote):
+        lote = nombres[inicio:inicio + tamano_lote]
+        _escribir_consola([f"{i:2d}. {nombre}" for i, nombre in enumerate(lote, inicio + 1)], salida)
+
+def _leer_y_ordenar(archivo_entrada, resultado, procesos, rechazos, archivo_rechazos):
+    """
+    Lee, valida y ordena el archivo, completando resultado.
+    Los errores de E/S se propagan para que procesar_nombres los informe.
+    """
+    mensajes = resultado.mensajes
+    if not os.path.exists(archivo_entrada):
+        mensajes.append(f"[ERROR] El archivo '{archivo_entrada}' no existe.")
+        return
+    
+    # Verificar si el archivo está vacío
+    if os.path.getsize(archivo_entrada) == 0:
+        mensajes.append(f"[ERROR] El archivo '{archivo_entrada}' está vacío.")
+        return
+    
+    # Leer el archivo en streaming: cada línea se limpia y valida al vuelo,
+    # sin cargar el archivo completo ni listas intermedias en memoria
+    inicio = time.perf_counter()
+    estadisticas = {}
+    if procesos and procesos > 1:
+        from validacion_paralela import validar_archivo_paralelo
+        nombres_validos, invalidos, total_lineas = validar_archivo_paralelo(archivo_entrada, procesos)
+        estadisticas.update(
+            lineas=total_lineas,
+            no_vacias=len(nombres_validos) + len(invalidos),
+            validos=len(nombres_validos),
+            invalidos=len(invalidos),
+            ejemplos_invalidos=[linea for _, linea in invalidos[:5]],
+        )
+        if rechazos is not None:
+            rechazos.writelines(f"{numero}\t{linea}\n" for numero, linea in invalidos)
+    else:
+        nombres_validos = list(leer_nombres(archivo_entrada, estadisticas=estadisticas, rechazos=rechazos))
+    resultado.tiempos["lectura"] = time.perf_counter() - inicio
+    
+    # Ordenar en el lugar usando la función de normalización personalizada
+    # (única materialización: la lista ordenada que se devuelve)
+    inicio = time.perf_counter()
+    nombres_validos.sort(key=normalizar_para_ordenar)
+    nombres_ordenados = nombres_validos
+    resultado.tiempos["ordenamiento"] = time.perf_counter() - inicio
+    
+    resultado.total_lineas = estadisticas["lineas"]
+    resultado.lineas_no_vacias = estadisticas["no_vacias"]
+    resultado.cantidad_invalidos = estadisticas["invalidos"]
+    resultado.ejemplos_invalidos = estadisticas["ejemplos_invalidos"]
+    
+    # Verificar si se pudieron leer líneas
+    if not estadisticas["lineas"]:
+        mensajes.append(f"[ERROR] No se pudieron leer líneas del archivo '{archivo_entrada}'.")
+        return
+    
+    # Verificar si hay nombres después de la limpieza
+    if not estadisticas["no_vacias"]:
+        mensajes.append(f"[ERROR] El archivo '{archivo_entrada}' no contiene datos válidos.")
+        mensajes.append("   El archivo puede contener solo líneas vacías o espacios en blanco.")
+        return
+    
+    # Advertencias sobre nombres inválidos si los hay
+    mensajes.extend(lineas_advertencia(resultado.cantidad_invalidos, resultado.ejemplos_invalidos,
+                                       len(nombres_ordenados), archivo_rechazos=archivo_rechazos))
+    
+    # Verificar si quedan nombres válidos después del filtrado
+    if not nombres_ordenados:
+        mensajes.append(f"[ERROR] No se encontraron nombres válidos en el archivo '{archivo_entrada}'.")
+        return
+    
+    resultado.nombres = nombres_ordenados
+
+def procesar_nombres(archivo_entrada, silencioso=False, archivo_rechazos=None, procesos=None):
+    """
+    Lee, valida y ordena un archivo de nombres y devuelve un resultado estructurado.
+    
+    Args:
+        archivo_entrada (str): Ruta del archivo de nombres (UTF-8)
+        silencioso (bool): Si es True no escribe nada en consola (modo batch);
+                           los diagnósticos quedan en resultado.mensajes
+        archivo_rechazos (str): Ruta opcional donde se guardan las líneas inválidas
+                                ("numero_linea<TAB>linea") en lugar de listarlas
+        procesos (int): Si es mayor que 1, valida en paralelo (ver validacion_paralela.py)
+    
+    Returns:
+        ResultadoOrdenamiento: Nombres ordenados, conteos, mensajes y tiempos
+    """
+    inicio = time.perf_counter()
+    resultado = ResultadoOrdenamiento(archivo=archivo_entrada)
+    mensajes = resultado.mensajes
+    
+    # El archivo de rechazos se abre aparte: sus errores no se confunden con los del archivo de entrada
+    rechazos = None
+    puede_procesar = True
+    if archivo_rechazos:
+        try:
+            rechazos = open(archivo_rechazos, 'w', encoding='utf-8')
+        except OSError as e:
+            mensajes.append(f"[ERROR] No se pudo crear el archivo de rechazos '{archivo_rechazos}': {e}")
+            puede_procesar = False
+    
+    try:
+        if puede_procesar:
+            try:
+                _leer_y_ordenar(archivo_entrada, resultado, procesos, rechazos, archivo_rechazos)
+            finally:
+                if rechazos is not None:
+                    rechazos.close()
     except FileNotFoundError:
-        print(f"[ERROR] No se pudo encontrar el archivo '{archivo_entrada}'.")
-        print("   Verifica que la ruta del archivo sea correcta.")
-        return []
+        mensajes.append(f"[ERROR] No se pudo encontrar el archivo '{archivo_entrada}'.")
+        mensajes.append("   Verifica que la ruta del archivo sea correcta.")
     except PermissionError:
-        print(f"[ERROR] No tienes permisos para leer el archivo '{archivo_entrada}'.")
-        return []
+        mensajes.append(f"[ERROR] No tienes permisos para leer el archivo '{archivo_entrada}'.")
     except UnicodeDecodeError as e:
-        print(f"[ERROR] No se pudo decodificar el archivo '{archivo_entrada}'.")
-        print(f"   Error de codificación: {e}")
-        print("   El archivo puede estar en una codificación diferente a UTF-8.")
-        return []
+        mensajes.append(f"[ERROR] No se pudo decodificar el archivo '{archivo_entrada}'.")
+        mensajes.append(f"   Error de codificación: {e}")
+        mensajes.append("   El archivo puede estar en una codificación diferente a UTF-8.")
     except OSError as e:
-        print(f"[ERROR] Error del sistema operativo al acceder al archivo '{archivo_entrada}': {e}")
-        return []
+        mensajes.append(f"[ERROR] Error del sistema operativo al acceder al archivo '{archivo_entrada}': {e}")
     except Exception as e:
-        try:
-            print(f"[ERROR] Error inesperado al procesar el archivo '{archivo_entrada}': {e}")
-            print(f"   Tipo de error: {type(e).__name__}")
-        except UnicodeEncodeError:
-            enc = (getattr(sys.stdout, 'encoding', None) or 'utf-8')
-            msg = str(e).encode(enc, errors='replace').decode(enc, errors='replace')
-            print(f"[ERROR] Error inesperado al procesar el archivo '{archivo_entrada}': {msg}")
-            print(f"   Tipo de error: {type(e).__name__}")
-        return []
+        mensajes.append(f"[ERROR] Error inesperado al procesar el archivo '{archivo_entrada}': {e}")
+        mensajes.append(f"   Tipo de error: {type(e).__name__}")
+    
+    if not silencioso:
+        inicio_salida = time.perf_counter()
+        _escribir_consola(mensajes)
+        if resultado.nombres:
+            _escribir_listado(resultado.nombres)
+        resultado.tiempos["salida"] = time.perf_counter() - inicio_salida
+    
+    resultado.tiempos["total"] = time.perf_counter() - inicio
+    return resultado
+
+def ordenar_nombres_alfabeticamente(archivo_entrada, procesos=None, silencioso=False, archivo_rechazos=None):
+    """
+    Lee nombres de un archivo y los ordena alfabéticamente.
+    Incluye manejo robusto de errores para diferentes escenarios.
+    
+    Si procesos es mayor que 1, la lectura y validación se reparten en bloques
+    entre varios procesos (ver validacion_paralela.py) con el mismo resultado.
+    Con silencioso=True no se escribe nada en consola; para obtener también
+    diagnósticos y tiempos usar procesar_nombres.
+    
+    Returns:
+        list: Nombres ordenados (lista vacía si hubo errores)
+    """
+    return procesar_nombres(archivo_entrada, silencioso, archivo_rechazos, procesos).nombres
 
 if __name__ == "__main__":
-    archivo = "nombres.txt"
-    nombres_ordenados = ordenar_nombres_alfabeticamente(archivo)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Ordena alfabéticamente los nombres de un archivo.")
+    parser.add_argument("archivo", nargs="?", default="nombres.txt", help="Archivo de nombres (por defecto nombres.txt)")
+    parser.add_argument("--silencioso", action="store_true", help="No listar nombres; solo mostrar un resumen con tiempos")
+    parser.add_argument("--rechazos", default=None, help="Archivo donde guardar las líneas inválidas")
+    parser.add_argument("--procesos", type=int, default=None, help="Cantidad de procesos para validar en paralelo")
+    args = parser.parse_args()
+    
+    resultado = procesar_nombres(args.archivo, args.silencioso, args.rechazos, args.procesos)
+    
+    if args.silencioso:
+        resumen = [linea for linea in resultado.mensajes if linea.startswith("[ERROR]")]
+        resumen.append(f"Nombres válidos: {len(resultado.nombres)} | "
+                       f"líneas inválidas: {resultado.cantidad_invalidos} | "
+                       f"líneas leídas: {resultado.total_lineas}")
+        resumen.append("Tiempos: " + ", ".join(f"{etapa} {segundos:.3f} s"
+                                               for etapa, segundos in resultado.tiempos.items()))
+        _escribir_consola(resumen)
+    elif resultado.nombres:
+        print(f"\nTotal de nombres procesados: {len(resultado.nombres)}")
     
-    if nombres_ordenados:
-        print(f"\nTotal de nombres procesados: {len(nombres_ordenados)}")
+    sys.exit(0 if resultado.exito else 1)
@@ -2,6 +2,74 @@
 
 # Importar la función para leer nombres del archivo ordenar_nombres.py
 from ordenar_nombres import ordenar_nombres_alfabeticamente
+from registro_nombre import RegistroNombre, crear_registros
+
+class DistribucionLongitudes:
+    """
+    Nombres agrupados en cubetas por longitud del primer nombre, calculadas en una
+    sola pasada junto con las estadísticas (ordenamiento por conteo, O(n)).
+    
+    Attributes:
+        cubetas (dict): Longitud -> lista de nombres con esa longitud, en el orden recibido
+        total (int): Cantidad de nombres
+        longitud_maxima (int): Mayor longitud del primer nombre (None si no hay nombres)
+        longitud_minima (int): Menor longitud del primer nombre (None si no hay nombres)
+        longitud_promedio (float): Promedio de longitudes del primer nombre
+    """
+    
+    def __init__(self, nombres=()):
+        self.cubetas = {}
+        self.total = 0
+        self.longitud_maxima = None
+        self.longitud_minima = None
+        suma = 0
+        cubetas = self.cubetas
+        for nombre in nombres:
+            if isinstance(nombre, RegistroNombre):
+                longitud = nombre.longitud_nombre
+            else:
+                longitud = len(nombre.split(None, 1)[0])
+            cubeta = cubetas.get(longitud)
+            if cubeta is None:
+                cubetas[longitud] = cubeta = []
+            cubeta.append(nombre)
+            suma += longitud
+        self.total = sum(len(cubeta) for cubeta in cubetas.values())
+        if self.cubetas:
+            self.longitud_maxima = max(self.cubetas)
+            self.longitud_minima = min(self.cubetas)
+        self.longitud_promedio = suma / self.total if self.total else 0.0
+    
+    def longitudes(self):
+        """
+        Longitudes presentes, de mayor a menor.
+        """
+        return sorted(self.cubetas, reverse=True)
+    
+    def conteos(self):
+        """
+        Tuplas (longitud, cantidad de nombres) de mayor a menor longitud, listas para graficar.
+        """
+        return [(longitud, len(self.cubetas[longitud])) for longitud in self.longitudes()]
+    
+    def nombres_ordenados(self):
+        """
+        Todos los nombres de mayor a menor longitud del primer nombre; dentro de
+        cada longitud se mantiene el orden recibido (igual que un sort estable).
+        """
+        ordenados = []
+        for longitud in self.longitudes():
+            ordenados.extend(self.cubetas[longitud])
+        return ordenados
+
+def agrupar_por_longitud(nombres):
+    """
+    Agrupa nombres (str o RegistroNombre) por longitud del primer nombre en una sola pasada.
+    
+    Returns:
+        DistribucionLongitudes: Cubetas, distribución y estadísticas
+    """
+    return DistribucionLongitudes(nombres)
 
 def ordenar_por_longitud_descendente(nombres):
     """
@@ -9,57 +77,57 @@ def ordenar_por_longitud_descendente(nombres):
     (de mayor a menor longitud del primer nombre).
     
     Args:
-        nombres (list): Lista de nombres completos
+        nombres (iterable): Nombres completos (str o RegistroNombre); acepta listas
+                            o iteradores como el de leer_nombres (se recorre una sola vez).
+                            Con una TablaNombres se ordena con un argsort estable
         
     Returns:
         list: Lista ordenada por longitud del primer nombre descendente
+              (una TablaNombres si se recibió una tabla)
     """
-    # Ordenar por longitud del primer nombre descendente (de mayor a menor)
-    nombres_ordenados = sorted(nombres, key=lambda nombre: len(nombre.split()[0]), reverse=True)
-    return nombres_ordenados
+    if hasattr(nombres, "ordenar_por_longitud_descendente"):
+        return nombres.ordenar_por_longitud_descendente()
+    
+    # Ordenamiento por cubetas: la clave es un entero chico, no hace falta comparar
+    return agrupar_por_longitud(nombres).nombres_ordenados()
 
 def mostrar_nombres_por_longitud(nombres_ordenados):
     """
     Muestra los nombres ordenados por longitud del primer nombre de manera clara.
+    Cada nombre se analiza una sola vez (RegistroNombre) y la distribución se
+    calcula en una sola pasada.
     """
+    registros = list(crear_registros(nombres_ordenados))
+    distribucion = agrupar_por_longitud(registros)
     print("Nombres ordenados por longitud del primer nombre (descendente):")
     print("=" * 60)
     
-    for i, nombre in enumerate(nombres_ordenados, 1):
-        primer_nombre = nombre.split()[0]
-        longitud_primer_nombre = len(primer_nombre)
-        print(f"{i:2d}. {nombre} (primer nombre: '{primer_nombre}' - {longitud_primer_nombre} caracteres)")
+    for i, registro in enumerate(registros, 1):
+        print(f"{i:2d}. {registro} (primer nombre: '{registro.nombre}' - {registro.longitud_nombre} caracteres)")
     
     print()
     print("Estadísticas de longitud del primer nombre:")
     print("-" * 40)
     
-    # Calcular estadísticas del primer nombre
-    longitudes_primer_nombre = [len(nombre.split()[0]) for nombre in nombres_ordenados]
-    longitud_maxima = max(longitudes_primer_nombre)
-    longitud_minima = min(longitudes_primer_nombre)
-    longitud_promedio = sum(longitudes_primer_nombre) / len(longitudes_primer_nombre)
-    
-    print(f"Longitud máxima del primer nombre: {longitud_maxima} caracteres")
-    print(f"Longitud mínima del primer nombre: {longitud_minima} caracteres")
-    print(f"Longitud promedio del primer nombre: {longitud_promedio:.1f} caracteres")
+    print(f"Longitud máxima del primer nombre: {distribucion.longitud_maxima} caracteres")
+    print(f"Longitud mínima del primer nombre: {distribucion.longitud_minima} caracteres")
+    print(f"Longitud promedio del primer nombre: {distribucion.longitud_promedio:.1f} caracteres")
     
     # Agrupar por longitud del primer nombre
     print()
     print("Distribución por longitud del primer nombre:")
     print("-" * 45)
-    longitudes_unicas = sorted(set(longitudes_primer_nombre), reverse=True)
-    for longitud in longitudes_unicas:
-        nombres_con_longitud = [nombre for nombre in nombres_ordenados if len(nombre.split()[0]) == longitud]
+    for longitud in distribucion.longitudes():
+        nombres_con_longitud = distribucion.cubetas[longitud]
         print(f"{longitud} caracteres: {len(nombres_con_longitud)} nombres")
-        for nombre in nombres_con_longitud:
-            primer_nombre = nombre.split()[0]
-            print(f"  - {nombre} (primer nombre: '{primer_nombre}')")
+        for registro in nombres_con_longitud:
+            print(f"  - {registro} (primer nombre: '{registro.nombre}')")
 
 if __name__ == '__main__':
     # Leer nombres del archivo nombres.txt usando la función de ordenar_nombres.py
     archivo = "nombres.txt"
-    nombres_originales = ordenar_nombres_alfabeticamente(archivo)
+    # Analizar cada nombre una sola vez y reutilizar los registros
+    nombres_originales = list(crear_registros(ordenar_nombres_alfabeticamente(archivo)))
     
     if nombres_originales:
         # Ordenar por longitud descendente
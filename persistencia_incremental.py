@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import tempfile
+
+# Importar funciones de los archivos existentes
+from contar_frecuencia_nombres import ContadorFrecuencias
+from validacion_nombres import es_nombre_valido
+
+ARCHIVO_SNAPSHOT = "snapshot.json"
+ARCHIVO_DELTAS = "deltas.jsonl"
+# Cantidad de deltas acumulados a partir de la cual se compactan en el snapshot
+MAX_DELTAS = 20
+# Bytes del principio del archivo que se usan para reconocerlo (junto con el inodo)
+TAMANO_HUELLA = 4096
+
+def _escribir_json_atomico(ruta, datos):
+    """
+    Escribe un JSON en un archivo temporal y lo renombra, para no dejarlo a medio escribir.
+    """
+    descriptor, ruta_temporal = tempfile.mkstemp(prefix=".snapshot_", dir=os.path.dirname(ruta))
+    try:
+        with open(descriptor, 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo, ensure_ascii=False)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(ruta_temporal, ruta)
+    except BaseException:
+        os.remove(ruta_temporal)
+        raise
+
+def _huella(ruta, hasta):
+    """
+    Identifica el archivo ya procesado: inodo y hash de sus primeros bytes
+    (hasta TAMANO_HUELLA, sin pasar de hasta, que ya se consumieron).
+    """
+    largo = min(hasta, TAMANO_HUELLA)
+    with open(ruta, 'rb') as archivo:
+        inicio = archivo.read(largo)
+        inodo = os.fstat(archivo.fileno()).st_ino
+    return {"inodo": inodo, "largo": largo, "hash": hashlib.blake2b(inicio, digest_size=16).hexdigest()}
+
+def _es_el_mismo_archivo(ruta, huella):
+    """
+    Indica si ruta sigue siendo el archivo de la huella guardada. Un estado
+    sin huella (de una versión anterior) se acepta tal cual.
+    """
+    if huella is None:
+        return True
+    try:
+        return _huella(ruta, huella["largo"]) == huella
+    except OSError:
+        return False
+
+def _leer_deltas(ruta_deltas, offset_snapshot):
+    """
+    Lee los deltas posteriores al snapshot. Si el último quedó incompleto
+    (corte durante la escritura), se descarta y se trunca el archivo.
+
+    Returns:
+        list: Registros {"desde", "hasta", "frecuencias"} en orden
+    """
+    deltas = []
+    if not os.path.exists(ruta_deltas):
+        return deltas
+    posicion_valida = 0
+    with open(ruta_deltas, 'rb') as archivo:
+        for linea in archivo:
+            try:
+                if not linea.endswith(b"\n"):
+                    raise ValueError("delta incompleto")
+                delta = json.loads(linea)
+            except ValueError:
+                break
+            posicion_valida += len(linea)
+            # Un delta ya incluido en el snapshot (corte durante la compactación) se ignora
+            if delta["hasta"] > offset_snapshot:
+                deltas.append(delta)
+    if posicion_valida != os.path.getsize(ruta_deltas):
+        os.truncate(ruta_deltas, posicion_valida)
+    return deltas
+
+def cargar_estado(directorio_estado):
+    """
+    Reconstruye el estado persistido: snapshot más todos los deltas.
+
+    Returns:
+        tuple: (archivo de origen o None, offset consumido, ContadorFrecuencias,
+                cantidad de deltas, huella del archivo de origen o None)
+    """
+    ruta_snapshot = os.path.join(directorio_estado, ARCHIVO_SNAPSHOT)
+    archivo_origen = None
+    offset = 0
+    contador = ContadorFrecuencias()
+    huella = None
+    if os.path.exists(ruta_snapshot):
+        with open(ruta_snapshot, 'r', encoding='utf-8') as archivo:
+            snapshot = json.load(archivo)
+        archivo_origen = snapshot["archivo"]
+        offset = snapshot["offset"]
+        contador.fusionar(snapshot["frecuencias"])
+        huella = snapshot.get("huella")
+
+    deltas = _leer_deltas(os.path.join(directorio_estado, ARCHIVO_DELTAS), offset)
+    for delta in deltas:
+        contador.fusionar(delta["frecuencias"])
+        offset = delta["hasta"]
+        huella = delta.get("huella", huella)
+    return archivo_origen, offset, contador, len(deltas), huella
+
+def compactar(directorio_estado, archivo_origen, offset, contador, huella=None):
+    """
+    Vuelca el estado completo en un nuevo snapshot y vacía el archivo de deltas.
+    """
+    _escribir_json_atomico(os.path.join(directorio_estado, ARCHIVO_SNAPSHOT), {
+        "archivo": archivo_origen,
+        "offset": offset,
+        "huella": huella,
+        "frecuencias": contador.frecuencias,
+    })
+    # Si hay un corte aquí, los deltas viejos se ignoran por su offset al cargar
+    with open(os.path.join(directorio_estado, ARCHIVO_DELTAS), 'w', encoding='utf-8'):
+        pass
+
+def _fin_ultima_linea_completa(archivo_entrada, desde, hasta):
+    """
+    Posición justo después del último salto de línea en [desde, hasta),
+    para no consumir una línea que todavía se está escribiendo.
+    """
+    with open(archivo_entrada, 'rb') as archivo:
+        posicion = hasta
+        while posicion > desde:
+            inicio = max(desde, posicion - 65536)
+            archivo.seek(inicio)
+            bloque = archivo.read(posicion - inicio)
+            indice = bloque.rfind(b"\n")
+            if indice != -1:
+                return inicio + indice + 1
+            posicion = inicio
+    return desde
+
+def _leer_lineas(archivo_entrada, desde, hasta):
+    """
+    Recorre las líneas entre los bytes desde y hasta de a una, sin cargar el
+    rango en memoria, con las mismas reglas de fin de línea que el modo texto
+    ('\\n', '\\r\\n' y '\\r'). hasta debe estar justo después de un salto de línea.
+    """
+    with open(archivo_entrada, 'rb') as archivo:
+        archivo.seek(desde)
+        posicion = desde
+        for crudo in archivo:
+            posicion += len(crudo)
+            linea = crudo.decode('utf-8')
+            if '\r' in linea:
+                linea = linea.replace('\r\n', '\n').replace('\r', '\n')
+                yield from (linea[:-1] if linea.endswith('\n') else linea).split('\n')
+            else:
+                yield linea
+            if posicion >= hasta:
+                return
+
+def actualizar_frecuencias_incremental(archivo_entrada, directorio_estado, max_deltas=MAX_DELTAS):
+    """
+    Actualiza las frecuencias de primer nombre procesando solo las líneas
+    agregadas a archivo_entrada desde la última ejecución.
+
+    El estado se guarda en directorio_estado como un snapshot más un archivo
+    de deltas de solo-agregado; cada ejecución agrega un delta compacto con
+    las frecuencias de las líneas nuevas y, cada max_deltas deltas, se
+    compacta todo en el snapshot. Si el archivo de entrada cambió de ruta, se
+    achicó o ya no es el mismo (otro inodo o distinto principio: rotado,
+    truncado o reemplazado), se vuelve a procesar desde el principio.
+    Una última línea sin salto de línea final se cuenta recién cuando se completa.
+
+    Returns:
+        tuple: (ContadorFrecuencias con el total, cantidad de nombres nuevos contados)
+    """
+    os.makedirs(directorio_estado, exist_ok=True)
+    archivo_entrada_abs = os.path.abspath(archivo_entrada)
+    archivo_origen, offset, contador, cantidad_deltas, huella = cargar_estado(directorio_estado)
+
+    tamano = os.path.getsize(archivo_entrada_abs)
+    if (archivo_origen != archivo_entrada_abs or tamano < offset
+            or not _es_el_mismo_archivo(archivo_entrada_abs, huella)):
+        offset = 0
+        contador = ContadorFrecuencias()
+        compactar(directorio_estado, archivo_entrada_abs, 0, contador)
+        cantidad_deltas = 0
+
+    fin = _fin_ultima_linea_completa(archivo_entrada_abs, offset, tamano)
+    if fin <= offset:
+        return contador, 0
+
+    delta = ContadorFrecuencias()
+    for linea in _leer_lineas(archivo_entrada_abs, offset, fin):
+        nombre = linea.strip()
+        if nombre and es_nombre_valido(nombre):
+            delta.agregar(nombre)
+
+    huella = _huella(archivo_entrada_abs, fin)
+    with open(os.path.join(directorio_estado, ARCHIVO_DELTAS), 'a', encoding='utf-8') as archivo:
+        archivo.write(json.dumps({"desde": offset, "hasta": fin, "huella": huella,
+                                  "frecuencias": delta.frecuencias}, ensure_ascii=False) + "\n")
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    contador.fusionar(delta)
+    cantidad_deltas += 1
+
+    if cantidad_deltas >= max_deltas:
+        compactar(directorio_estado, archivo_entrada_abs, fin, contador, huella)
+    return contador, delta.total
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+from operator import attrgetter
+
+# Importar la clave de ordenación y el lector en streaming de ordenar_nombres.py
+from ordenar_nombres import leer_nombres, normalizar_para_ordenar
+
+class RegistroNombre:
+    """
+    Nombre completo ya analizado una sola vez, para no repetir split() en cada función.
+
+    Attributes:
+        completo (str): Nombre completo tal como aparece en el archivo
+        nombre (str): Primer nombre
+        apellido (str): Resto del nombre completo (apellido o apellidos)
+        longitud_nombre (int): Cantidad de caracteres del primer nombre
+        clave (str): Clave de ordenación alfabética (normalizar_para_ordenar)
+    """
+    __slots__ = ("completo", "nombre", "apellido", "longitud_nombre", "clave")
+
+    def __init__(self, completo):
+        partes = completo.split(None, 1)
+        self.completo = completo
+        self.nombre = partes[0] if partes else ""
+        self.apellido = partes[1] if len(partes) > 1 else ""
+        self.longitud_nombre = len(self.nombre)
+        self.clave = normalizar_para_ordenar(completo)
+
+    def __str__(self):
+        return self.completo
+
+    def __repr__(self):
+        return f"RegistroNombre({self.completo!r})"
+
+    def __eq__(self, otro):
+        if isinstance(otro, RegistroNombre):
+            return self.completo == otro.completo
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.completo)
+
+# Clave para ordenar registros alfabéticamente (mismo orden que normalizar_para_ordenar)
+clave_alfabetica = attrgetter("clave")
+
+def a_registro(valor):
+    """
+    Devuelve valor si ya es un RegistroNombre; si es un str, lo analiza.
+    """
+    return valor if isinstance(valor, RegistroNombre) else RegistroNombre(valor)
+
+def crear_registros(nombres):
+    """
+    Convierte un iterable de nombres (str o RegistroNombre) en registros, de a uno.
+    """
+    for nombre in nombres:
+        yield a_registro(nombre)
+
+def leer_registros(archivo_entrada, estadisticas=None):
+    """
+    Lee un archivo en streaming y produce un RegistroNombre por cada nombre válido.
+    Acepta los mismos argumentos opcionales que leer_nombres.
+    """
+    for nombre in leer_nombres(archivo_entrada, estadisticas=estadisticas):
+        yield RegistroNombre(nombre)
+
+def primer_nombre(valor):
+    """
+    Primer nombre de un RegistroNombre (sin recalcular) o de un str.
+    """
+    if isinstance(valor, RegistroNombre):
+        return valor.nombre
+    return valor.split()[0]
+
+def longitud_primer_nombre(valor):
+    """
+    Longitud del primer nombre de un RegistroNombre (sin recalcular) o de un str.
+    """
+    if isinstance(valor, RegistroNombre):
+        return valor.longitud_nombre
+    return len(valor.split()[0])
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+
+import numpy as np
+
+# Importar el lector en streaming de ordenar_nombres.py
+from ordenar_nombres import leer_nombres
+
+class TablaNombres:
+    """
+    Tabla columnar de nombres completos con codificación por diccionario.
+
+    Cada primer nombre y cada apellido distinto se guarda una sola vez en un
+    vocabulario; las filas son arreglos NumPy de códigos enteros. Así millones
+    de nombres ocupan unos pocos bytes por fila y las operaciones de conteo,
+    filtrado y ordenamiento se resuelven vectorizadas.
+
+    Attributes:
+        vocabulario_nombres (list): Primeros nombres distintos (índice = código)
+        vocabulario_apellidos (list): Apellidos distintos (índice = código)
+        codigos_nombre (np.ndarray): Código del primer nombre de cada fila
+        codigos_apellido (np.ndarray): Código del apellido de cada fila
+        longitudes (np.ndarray): Longitud del primer nombre de cada fila
+    """
+
+    def __init__(self, vocabulario_nombres, vocabulario_apellidos, codigos_nombre, codigos_apellido, longitudes):
+        self.vocabulario_nombres = vocabulario_nombres
+        self.vocabulario_apellidos = vocabulario_apellidos
+        self.codigos_nombre = codigos_nombre
+        self.codigos_apellido = codigos_apellido
+        self.longitudes = longitudes
+
+    @classmethod
+    def desde_nombres(cls, nombres):
+        """
+        Construye la tabla a partir de un iterable de nombres completos
+        (str o RegistroNombre), recorriéndolo una sola vez.
+        """
+        indice_nombres = {}
+        indice_apellidos = {}
+        codigos_nombre = array('i')
+        codigos_apellido = array('i')
+
+        for nombre_completo in nombres:
+            partes = str(nombre_completo).split(None, 1)
+            primer_nombre = partes[0]
+            apellido = partes[1] if len(partes) > 1 else ""
+            codigos_nombre.append(indice_nombres.setdefault(primer_nombre, len(indice_nombres)))
+            codigos_apellido.append(indice_apellidos.setdefault(apellido, len(indice_apellidos)))
+
+        vocabulario_nombres = list(indice_nombres)
+        codigos = np.frombuffer(codigos_nombre, dtype=np.int32).copy()
+        # La longitud se calcula una vez por nombre distinto y se expande por código
+        longitudes_vocabulario = np.fromiter((len(nombre) for nombre in vocabulario_nombres),
+                                             dtype=np.int16, count=len(vocabulario_nombres))
+        return cls(
+            vocabulario_nombres,
+            list(indice_apellidos),
+            codigos,
+            np.frombuffer(codigos_apellido, dtype=np.int32).copy(),
+            longitudes_vocabulario[codigos],
+        )
+
+    @classmethod
+    def desde_archivo(cls, archivo_entrada):
+        """
+        Lee y valida un archivo en streaming y lo carga directamente en la tabla.
+        """
+        return cls.desde_nombres(leer_nombres(archivo_entrada))
+
+    def __len__(self):
+        return len(self.codigos_nombre)
+
+    def __getitem__(self, indice):
+        """
+        Nombre completo de la fila indicada (primer nombre y apellido separados por un espacio).
+        """
+        apellido = self.vocabulario_apellidos[self.codigos_apellido[indice]]
+        primer_nombre = self.vocabulario_nombres[self.codigos_nombre[indice]]
+        return f"{primer_nombre} {apellido}" if apellido else primer_nombre
+
+    def __iter__(self):
+        nombres = self.vocabulario_nombres
+        apellidos = self.vocabulario_apellidos
+        for codigo_nombre, codigo_apellido in zip(self.codigos_nombre.tolist(), self.codigos_apellido.tolist()):
+            apellido = apellidos[codigo_apellido]
+            yield f"{nombres[codigo_nombre]} {apellido}" if apellido else nombres[codigo_nombre]
+
+    def subconjunto(self, selector):
+        """
+        Nueva tabla con las filas indicadas por una máscara booleana o un arreglo de índices.
+        Comparte los vocabularios con la tabla original.
+        """
+        return TablaNombres(
+            self.vocabulario_nombres,
+            self.vocabulario_apellidos,
+            self.codigos_nombre[selector],
+            self.codigos_apellido[selector],
+            self.longitudes[selector],
+        )
+
+    def frecuencia_primer_nombre(self):
+        """
+        Frecuencia de cada primer nombre con np.bincount sobre los códigos.
+
+        Returns:
+            dict: Primer nombre -> frecuencia (mismo formato que contar_frecuencia_nombres)
+        """
+        conteos = np.bincount(self.codigos_nombre, minlength=len(self.vocabulario_nombres))
+        presentes = np.flatnonzero(conteos)
+        return {self.vocabulario_nombres[codigo]: frecuencia
+                for codigo, frecuencia in zip(presentes.tolist(), conteos[presentes].tolist())}
+
+    def mascara_nombres_largos(self, longitud_minima=4):
+        """
+        Máscara booleana de las filas cuyo primer nombre tiene más de longitud_minima caracteres.
+        """
+        return self.longitudes > longitud_minima
+
+    def filtrar_nombres_largos(self, longitud_minima=4):
+        """
+        Filas cuyo primer nombre tiene más de longitud_minima caracteres, en el orden original.
+        """
+        return self.subconjunto(self.mascara_nombres_largos(longitud_minima))
+
+    def ordenar_por_longitud_descendente(self):
+        """
+        Filas ordenadas por longitud del primer nombre de mayor a menor.
+        El argsort es estable, igual que sorted(..., reverse=True).
+        """
+        return self.subconjunto(np.argsort(-self.longitudes.astype(np.int32), kind="stable"))
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import re
+from dataclasses import dataclass, field
+
+# Formato "Nombre Apellido" compilado en una sola expresión:
+# - al menos 2 palabras separadas por espacios
+# - cada palabra con al menos 2 letras ([^\W\d_] = letra Unicode, sin dígitos ni '_')
+# Esto excluye también números, símbolos y barras invertidas.
+PATRON_NOMBRE = re.compile(r"[^\W\d_]{2,}(?:\s+[^\W\d_]{2,})+")
+
+def es_nombre_valido(nombre):
+    """
+    Indica si una línea (ya limpia de espacios) tiene formato "Nombre Apellido".
+
+    Reglas estrictas:
+    - Solo letras, espacios y acentos (sin números, símbolos, barras invertidas)
+    - Al menos 2 palabras separadas por espacios
+    - Cada palabra debe tener al menos 2 letras
+    """
+    if PATRON_NOMBRE.fullmatch(nombre) is None:
+        return False
+    # [^\W\d_] admite algunos caracteres numéricos no ASCII (como '²' o '½')
+    # que str.isalpha rechaza; solo hace falta comprobarlo fuera de ASCII
+    return nombre.isascii() or "".join(nombre.split()).isalpha()
+
+def lineas_advertencia(cantidad_invalidos, ejemplos_invalidos, cantidad_validos, max_ejemplos=5,
+                       archivo_rechazos=None):
+    """
+    Arma las líneas del aviso de datos inválidos que muestran la consola y la GUI.
+    Si las líneas rechazadas se guardaron en archivo_rechazos, se indica ese archivo
+    en lugar de listar ejemplos.
+    """
+    if not cantidad_invalidos:
+        return []
+    lineas = [
+        f"[ADVERTENCIA] Se encontraron {cantidad_invalidos} líneas con datos inválidos:",
+        "   (Strings extraños, formato incorrecto, o solo espacios/saltos de línea)",
+    ]
+    if archivo_rechazos:
+        lineas.append(f"   Detalle de las líneas rechazadas en '{archivo_rechazos}'.")
+    else:
+        for nombre_invalido in ejemplos_invalidos[:max_ejemplos]:
+            lineas.append(f"   - '{str(nombre_invalido)}'")
+        if cantidad_invalidos > max_ejemplos:
+            lineas.append(f"   ... y {cantidad_invalidos - max_ejemplos} más.")
+    lineas.append("")
+
+    # Si hay nombres válidos, mostrar mensaje de éxito parcial
+    if cantidad_validos:
+        lineas.append(f"[INFO] Sin embargo, se encontraron {cantidad_validos} nombres válidos que serán procesados.")
+        lineas.append("")
+    return lineas
+
+@dataclass
+class ResultadoValidacion:
+    """
+    Resultado estructurado de validar_nombres.
+
+    Attributes:
+        validos (list): Nombres válidos, limpios y en el orden de entrada
+        invalidos (list): Tuplas (numero_linea, linea) de las líneas rechazadas
+        total_lineas (int): Cantidad de líneas leídas (incluidas las vacías)
+        lineas_vacias (int): Cantidad de líneas vacías o con solo espacios
+    """
+    validos: list = field(default_factory=list)
+    invalidos: list = field(default_factory=list)
+    total_lineas: int = 0
+    lineas_vacias: int = 0
+
+    @property
+    def cantidad_validos(self):
+        return len(self.validos)
+
+    @property
+    def cantidad_invalidos(self):
+        return len(self.invalidos)
+
+    @property
+    def cantidad_no_vacias(self):
+        return self.total_lineas - self.lineas_vacias
+
+    def reporte(self, max_ejemplos=5):
+        """
+        Devuelve las líneas de advertencia sobre datos inválidos (vacía si no hay).
+        """
+        ejemplos = [linea for _, linea in self.invalidos[:max_ejemplos]]
+        return lineas_advertencia(self.cantidad_invalidos, ejemplos, self.cantidad_validos, max_ejemplos)
+
+def validar_nombres(lineas, primera_linea=1):
+    """
+    Valida un iterable de líneas (por ejemplo, un archivo abierto) en una sola
+    pasada por línea, sin imprimir nada.
+
+    Args:
+        lineas (iterable): Líneas de texto, con o sin salto de línea final
+        primera_linea (int): Número asignado a la primera línea (por defecto 1)
+
+    Returns:
+        ResultadoValidacion: Conteos, nombres válidos y líneas rechazadas con su número
+    """
+    resultado = ResultadoValidacion()
+    validos = resultado.validos
+    invalidos = resultado.invalidos
+    numero = primera_linea - 1
+    vacias = 0
+
+    for numero, linea in enumerate(lineas, primera_linea):
+        nombre = linea.strip()
+        if not nombre:
+            vacias += 1
+        elif es_nombre_valido(nombre):
+            validos.append(nombre)
+        else:
+            invalidos.append((numero, nombre))
+
+    resultado.total_lineas = numero - primera_linea + 1
+    resultado.lineas_vacias = vacias
+    return resultado
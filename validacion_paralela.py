@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Importar la validación compilada de validacion_nombres.py
+from validacion_nombres import es_nombre_valido
+
+# Tamaño mínimo de cada bloque del archivo que procesa un proceso
+TAMANO_MINIMO_BLOQUE = 1024 * 1024
+# Bloques por proceso: más de uno reparte mejor la carga entre núcleos
+BLOQUES_POR_PROCESO = 4
+
+def calcular_bloques(archivo_entrada, cantidad_bloques, tamano_minimo=TAMANO_MINIMO_BLOQUE):
+    """
+    Divide un archivo en rangos de bytes (inicio, fin) alineados a saltos de línea,
+    de modo que ninguna línea quede partida entre dos bloques.
+
+    Args:
+        archivo_entrada (str): Ruta del archivo
+        cantidad_bloques (int): Cantidad deseada de bloques
+        tamano_minimo (int): Tamaño mínimo en bytes de cada bloque
+
+    Returns:
+        list: Lista de tuplas (inicio, fin) en el orden del archivo
+    """
+    tamano = os.path.getsize(archivo_entrada)
+    if tamano == 0:
+        return []
+    paso = max(tamano_minimo, -(-tamano // max(1, cantidad_bloques)))
+
+    bloques = []
+    inicio = 0
+    with open(archivo_entrada, 'rb') as archivo:
+        while inicio < tamano:
+            fin = inicio + paso
+            if fin < tamano:
+                # Avanzar hasta justo después del siguiente salto de línea
+                archivo.seek(fin)
+                archivo.readline()
+                fin = archivo.tell()
+            fin = min(fin, tamano)
+            bloques.append((inicio, fin))
+            inicio = fin
+    return bloques
+
+def leer_lineas_bloque(archivo_entrada, inicio, fin):
+    """
+    Lee las líneas de un bloque de bytes con las mismas reglas de fin de línea
+    que la lectura en modo texto de Python ('\\n', '\\r\\n' y '\\r').
+    """
+    with open(archivo_entrada, 'rb') as archivo:
+        archivo.seek(inicio)
+        datos = archivo.read(fin - inicio)
+    texto = datos.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    lineas = texto.split('\n')
+    if lineas and lineas[-1] == '':
+        lineas.pop()
+    return lineas
+
+def _validar_bloque(argumentos):
+    """
+    Trabajo de cada proceso: valida las líneas de un bloque.
+    Devuelve los nombres válidos, los inválidos con su número de línea
+    relativo al bloque y la cantidad de líneas leídas.
+    """
+    archivo_entrada, inicio, fin = argumentos
+    lineas = leer_lineas_bloque(archivo_entrada, inicio, fin)
+    validos = []
+    invalidos = []
+    for indice, linea in enumerate(lineas):
+        nombre = linea.strip()
+        if not nombre:
+            continue
+        if es_nombre_valido(nombre):
+            validos.append(nombre)
+        else:
+            invalidos.append((indice, nombre))
+    return validos, invalidos, len(lineas)
+
+def _combinar_resultados(resultados):
+    """
+    Une los resultados de los bloques, en orden, desplazando los números de
+    línea de cada bloque según las líneas de los bloques anteriores.
+    """
+    nombres_validos = []
+    nombres_invalidos = []
+    total_lineas = 0
+    for validos, invalidos, cantidad in resultados:
+        nombres_validos.extend(validos)
+        nombres_invalidos.extend((total_lineas + indice + 1, linea) for indice, linea in invalidos)
+        total_lineas += cantidad
+    return nombres_validos, nombres_invalidos, total_lineas
+
+def validar_archivo_paralelo(archivo_entrada, procesos=None):
+    """
+    Valida un archivo de nombres repartiendo bloques alineados a saltos de línea
+    entre varios procesos. Acepta y rechaza exactamente las mismas líneas que
+    leer_nombres y conserva el orden original del archivo.
+
+    Args:
+        archivo_entrada (str): Ruta del archivo de nombres (UTF-8)
+        procesos (int): Cantidad de procesos (por defecto, uno por núcleo)
+
+    Returns:
+        tuple: (nombres_validos, nombres_invalidos, total_lineas), donde
+               nombres_invalidos es una lista de tuplas (numero_linea, linea)
+               con numeración desde 1
+    """
+    procesos = procesos or os.cpu_count() or 1
+    bloques = calcular_bloques(archivo_entrada, procesos * BLOQUES_POR_PROCESO)
+    tareas = [(archivo_entrada, inicio, fin) for inicio, fin in bloques]
+
+    if procesos == 1 or len(tareas) <= 1:
+        return _combinar_resultados(map(_validar_bloque, tareas))
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        return _combinar_resultados(ejecutor.map(_validar_bloque, tareas))
+
+if __name__ == '__main__':
+    import sys
+
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "nombres.txt"
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    validos, invalidos, total = validar_archivo_paralelo(archivo, procesos)
+    print(f"Líneas leídas: {total}")
+    print(f"Nombres válidos: {len(validos)}")
+    print(f"Líneas inválidas: {len(invalidos)}")
+    for numero, linea in invalidos[:5]:
+        print(f"   - línea {numero}: '{linea}'")